@@ -70,7 +70,11 @@ class CountryToAirport:
             )
             & (self.airports_df["type"] == "large_airport")
         ]
-        airports = [
-            (row["iata_code"], row["name"]) for _, row in subset.iterrows()
-        ]
+        # Pair the two columns as arrays instead of building a Series per row
+        airports = list(
+            zip(
+                subset["iata_code"].to_numpy().tolist(),
+                subset["name"].to_numpy().tolist(),
+            )
+        )
         return airports
\ No newline at end of file
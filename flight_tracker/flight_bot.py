@@ -12,6 +12,7 @@ Immediate-cancel support:
 - Short timeouts and polling loops avoid long blocking calls.
 """
 
+import functools
 import time
 from typing import Optional
 
@@ -20,7 +21,6 @@ from selenium import webdriver
 from selenium.common.exceptions import TimeoutException, WebDriverException
 from selenium.webdriver.common.by import By
 from selenium.webdriver.firefox.options import Options
-from win10toast import ToastNotifier
 
 
 class FlightBot:
@@ -31,6 +31,11 @@ class FlightBot:
     Cancellation:
     - Provide a threading.Event as cancel_event (or call request_cancel()).
     - If cancelled, the driver is quit immediately and the run returns None.
+
+    Reuse:
+    - With keep_driver=True the headless browser stays open after a run, so
+      the same bot can check other trips (set_query() then start()) without
+      launching Firefox again; call close() when done with it.
     """
 
     def __init__(
@@ -43,6 +48,7 @@ class FlightBot:
         driver_path: str = None,
         cancel_event=None,
         excluded_airlines: list[str] | None = None,
+        keep_driver: bool = False,
     ):
         """
         :param departure: IATA code of departure airport
@@ -54,21 +60,16 @@ class FlightBot:
         :param cancel_event: optional threading.Event for cooperative cancel
         :param excluded_airlines: optional list of airline names to exclude
                                   (case-insensitive substring match, e.g. ["china eastern"])
+        :param keep_driver: keep the browser open between runs (see close())
         """
-        self.departure = departure
-        self.destination = destination
-        self.dep_date = dep_date
-        self.arrival_date = arrival_date
+        self.set_query(departure, destination, dep_date, arrival_date)
         self.max_duration_flight = max_duration_flight
-        self.url = (
-            f"https://www.kayak.fr/flights/"
-            f"{departure}-{destination}/"
-            f"{dep_date}/{arrival_date}?sort=bestflight_a"
-        )
         self.driver_path = driver_path
-        self.notifier = ToastNotifier()
         self.cancel_event = cancel_event
+        self.keep_driver = keep_driver
         self._driver: Optional[webdriver.Firefox] = None
+        # The cookie banner only shows on a fresh browser profile
+        self._cookies_handled = False
 
         # Excluded airlines normalized to lowercase for substring checks
         self._excluded_airlines = [
@@ -77,6 +78,31 @@ class FlightBot:
             if s and s.strip()
         ]
 
+    def set_query(
+        self, departure: str, destination: str, dep_date: str, arrival_date: str
+    ) -> None:
+        """Point the bot at another round-trip (used when reusing a bot)."""
+        self.departure = departure
+        self.destination = destination
+        self.dep_date = dep_date
+        self.arrival_date = arrival_date
+        self.url = (
+            f"https://www.kayak.fr/flights/"
+            f"{departure}-{destination}/"
+            f"{dep_date}/{arrival_date}?sort=bestflight_a"
+        )
+
+    def close(self) -> None:
+        """Quit the browser kept open by keep_driver."""
+        self._quit_driver()
+
+    @functools.cached_property
+    def notifier(self):
+        """Windows toast notifier, created (and imported) on first use."""
+        from win10toast import ToastNotifier
+
+        return ToastNotifier()
+
     # ------------------------------------------------------------------ #
     # Cancellation helpers
     # ------------------------------------------------------------------ #
@@ -121,6 +147,7 @@ class FlightBot:
         """Safely quit and clear the WebDriver if it exists."""
         drv = self._driver
         self._driver = None
+        self._cookies_handled = False
         if drv is None:
             return
         try:
@@ -133,10 +160,11 @@ class FlightBot:
         Sleep up to total_seconds in small steps, returning False early if cancelled.
         :return: True if full duration elapsed, False if cancelled.
         """
+        if self.cancel_event is not None:
+            # One wait that wakes up as soon as the event is set
+            return not self.cancel_event.wait(total_seconds)
         elapsed = 0.0
         while elapsed < total_seconds:
-            if self._is_cancelled():
-                return False
             time.sleep(step)
             elapsed += step
         return True
@@ -146,8 +174,9 @@ class FlightBot:
         Try to click a 'Tout refuser' button if present, without blocking long.
         Uses short retries so cancellation can interrupt quickly.
         """
-        if self._driver is None:
+        if self._driver is None or self._cookies_handled:
             return
+        self._cookies_handled = True
         xpath = "//button[.//div[text()='Tout refuser']]"
         for _ in range(20):  # ~5s total at 0.25s per loop
             if self._is_cancelled() or self._driver is None:
@@ -160,7 +189,7 @@ class FlightBot:
                     pass
                 return
             except Exception:
-                time.sleep(0.25)
+                self._poll_sleep(0.25)
 
     # ------------------------------------------------------------------ #
     def _get_current_price(self) -> dict:
@@ -180,14 +209,16 @@ class FlightBot:
         # Reset offline flag for this call
         self._offline = False
 
+        reused = self._driver is not None
         try:
-            self._driver = (
-                webdriver.Firefox(
-                    executable_path=self.driver_path, options=options
+            if not reused:
+                self._driver = (
+                    webdriver.Firefox(
+                        executable_path=self.driver_path, options=options
+                    )
+                    if self.driver_path
+                    else webdriver.Firefox(options=options)
                 )
-                if self.driver_path
-                else webdriver.Firefox(options=options)
-            )
         except WebDriverException:
             self._driver = None
             self._offline = True
@@ -201,6 +232,10 @@ class FlightBot:
 
             try:
                 if self._driver is not None:
+                    if reused:
+                        # Leave the previous trip's results first, so a load
+                        # stopped at the timeout cannot show its page_source
+                        self._driver.get("about:blank")
                     self._driver.set_page_load_timeout(8)
                     self._driver.set_script_timeout(8)
                     self._driver.get(self.url)
@@ -231,10 +266,13 @@ class FlightBot:
                         break
                 except Exception:
                     pass
-                time.sleep(0.25)
+                self._poll_sleep(0.25)
 
         finally:
-            self._quit_driver()
+            # A kept browser that returned no page at all may be broken:
+            # start the next run with a fresh one
+            if not self.keep_driver or self._is_cancelled() or not html:
+                self._quit_driver()
 
         if self._is_cancelled():
             return None  # type: ignore
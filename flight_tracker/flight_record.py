@@ -18,10 +18,24 @@ Each record contains
 from __future__ import annotations
 
 import json
+import mmap
 import os
+import re
 import sys
+import threading
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
+
+try:  # optional faster decoder; parses the raw bytes of each line
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+# Large read buffer: fewer read() syscalls when iterating long histories
+_READ_BUFFER = 1 << 20
+
+# "price": <number> as written by json.dumps in save_records()
+_PRICE_RE = re.compile(rb'"price":\s*(-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)')
 
 
 def _default_store_file() -> str:
@@ -53,6 +67,34 @@ def _default_store_file() -> str:
     return "flight_records.jsonl"
 
 
+def make_record(
+    datetime_key: str,
+    departure: str,
+    destination: str,
+    company: str,
+    duration_out: str,
+    duration_return: str,
+    price: float,
+    dep_date: str | None = None,
+    arrival_date: str | None = None,
+) -> Dict:
+    """Build the dict stored for one scrape (see FlightRecord.save_record)."""
+    rec = {
+        "datetime": datetime_key,
+        "departure": departure,
+        "destination": destination,
+        "company": company,
+        "duration_out": duration_out,
+        "duration_return": duration_return,
+        "price": price,
+    }
+    if dep_date is not None:
+        rec["dep_date"] = dep_date
+    if arrival_date is not None:
+        rec["arrival_date"] = arrival_date
+    return rec
+
+
 class FlightRecord:
     """
     Simple JSON-lines store keeping only the *lowest* price per hour.
@@ -60,6 +102,15 @@ class FlightRecord:
 
     def __init__(self, path: str | None = None) -> None:
         self.path: str = path or _default_store_file()
+        # Bumped whenever the file is rewritten instead of appended to, so
+        # readers that resume from a byte offset know to start over.
+        self.rewrites: int = 0
+        # Held while a rewrite is swapped in, so readers can pair `rewrites`
+        # with the file they open, and around every use of the append handle.
+        # Reentrant so a caller can hold it across close() and a file delete.
+        self.lock = threading.RLock()
+        # Append handle kept open between saves (opened on first append)
+        self._fh = None
 
         # guarantee that the file exists and is writable
         Path(self.path).touch(exist_ok=True)
@@ -83,60 +134,224 @@ class FlightRecord:
         Persist a scrape result.
 
         If an entry already exists for *datetime_key* it is replaced only if the
-        new price is lower.
+        new price is lower (the file is then rewritten); a new hour is simply
+        appended.
 
         Stores optional dep_date/arrival_date so we can reconstruct a Kayak URL.
         """
-        records: list[dict] = []
-        existing_price: float | None = None
+        self.save_records(
+            [
+                make_record(
+                    datetime_key,
+                    departure,
+                    destination,
+                    company,
+                    duration_out,
+                    duration_return,
+                    price,
+                    dep_date,
+                    arrival_date,
+                )
+            ]
+        )
 
-        with open(self.path, "r", encoding="utf-8") as fh:
-            for line in fh:
+    def save_records(self, new_records: List[Dict]) -> List[Dict]:
+        """
+        Persist several scrape results (built with make_record) at once.
+
+        Same rules as save_record(), applied to the whole batch. Only the stored
+        lines of the batch's hours are decoded (see _hour_lines), and the file
+        is appended to or rewritten once.
+
+        :return: the records actually written, in write order.
+        """
+        batch: dict[str, dict] = {}
+        for rec in new_records:
+            key = rec["datetime"]
+            kept = batch.get(key)
+            if kept is None or rec["price"] < kept["price"]:
+                batch[key] = rec
+        if not batch:
+            return []
+
+        drop: list[tuple[int, int]] = []  # byte spans of replaced lines
+        for key, lines in self._hour_lines(batch).items():
+            # Usually one line per hour; a refused rewrite leaves the cheaper
+            # record appended after the stale one, so compare with the lowest
+            prices = []
+            for _, _, line in lines:
                 try:
-                    rec = json.loads(line)
+                    price = _loads(line).get("price")
                 except json.JSONDecodeError:
                     continue
+                if price is not None:
+                    prices.append(price)
+            if prices and min(prices) <= batch[key]["price"]:
+                del batch[key]  # the stored record is at least as cheap
+            else:
+                drop.extend((a, b) for a, b, _ in lines)
+        if not batch:
+            return []
+
+        payload = "".join(json.dumps(rec) + "\n" for rec in batch.values())
+        if not drop:
+            self._append(payload)
+            return list(batch.values())
+
+        self.close()  # the rewrite replaces the content under the handle
+        with open(self.path, "rb") as fh:
+            data = fh.read()
+        parts = []
+        pos = 0
+        for a, b in sorted(drop):
+            parts.append(data[pos:a])
+            pos = b
+        parts.append(data[pos:])
+        parts.append(payload.encode("utf-8"))
+        # Write a temporary file and swap it in: readers may hold an mmap of
+        # the records, and truncating the mapped file in place would fault
+        # them (SIGBUS) or be refused (Windows)
+        tmp_path = self.path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as fh:
+                fh.write(b"".join(parts))
+            with self.lock:
+                os.replace(tmp_path, self.path)
+                self.rewrites += 1
+        except OSError:
+            # Swap refused (file mapped by a reader on Windows): append the
+            # cheaper records instead, the stale lines go at the next rewrite
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            self._append(payload)
+        return list(batch.values())
+
+    def close(self) -> None:
+        """Close the append handle; the next save reopens it."""
+        with self.lock:
+            fh, self._fh = self._fh, None
+            if fh is not None:
+                try:
+                    fh.close()
+                except OSError:
+                    pass
+
+    def _append(self, payload: str) -> None:
+        """
+        Append *payload* through the kept handle, reopening it first when the
+        file it points to was deleted or replaced outside of this store.
+        """
+        with self.lock:
+            if self._fh is not None and not self._handle_current():
+                self.close()
+            if self._fh is None:
+                self._fh = open(self.path, "a", encoding="utf-8")
+            self._fh.write(payload)
+            self._fh.flush()  # readers mmap the file right after a save
+
+    def _handle_current(self) -> bool:
+        """Whether the append handle still writes to the file at self.path."""
+        try:
+            held = os.fstat(self._fh.fileno())
+            cur = os.stat(self.path)
+        except (OSError, ValueError):
+            return False
+        return held.st_nlink > 0 and (held.st_ino, held.st_dev) == (
+            cur.st_ino,
+            cur.st_dev,
+        )
 
-                if rec.get("datetime") == datetime_key:
-                    existing_price = rec.get("price")
-                else:
-                    records.append(rec)
-
-        if existing_price is not None and existing_price <= price:
-            return
-
-        new_rec = {
-            "datetime": datetime_key,
-            "departure": departure,
-            "destination": destination,
-            "company": company,
-            "duration_out": duration_out,
-            "duration_return": duration_return,
-            "price": price,
-        }
-        if dep_date is not None:
-            new_rec["dep_date"] = dep_date
-        if arrival_date is not None:
-            new_rec["arrival_date"] = arrival_date
-
-        records.append(new_rec)
-
-        with open(self.path, "w", encoding="utf-8") as fh:
-            for rec in records:
-                fh.write(json.dumps(rec) + "\n")
+    def _hour_lines(self, keys) -> Dict[str, List[tuple]]:
+        """
+        Locate the stored lines of the given hours with one bytes regex over
+        the memory-mapped file, without decoding it.
+
+        :return: {key: [(start, end, line bytes), ...]} in file order; end is
+                 just past the line's newline. Hours not stored are absent.
+        """
+        if not keys:
+            return {}
+        pattern = re.compile(
+            rb'"datetime":\s*"('
+            + b"|".join(re.escape(k.encode("utf-8")) for k in keys)
+            + rb')"'
+        )
+        found: dict[str, list[tuple]] = {}
+        try:
+            fd = os.open(self.path, os.O_RDONLY)
+        except FileNotFoundError:
+            return found
+        try:
+            if os.fstat(fd).st_size == 0:  # mmap refuses empty files
+                return found
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                for m in pattern.finditer(mm):
+                    start = mm.rfind(b"\n", 0, m.start()) + 1
+                    nl = mm.find(b"\n", m.end())
+                    end = len(mm) if nl < 0 else nl + 1
+                    key = m.group(1).decode("utf-8")
+                    found.setdefault(key, []).append((start, end, mm[start:end]))
+        finally:
+            os.close(fd)
+        return found
 
     # ------------------------------------------------------------------ #
     def load_record(self, datetime_key: str) -> Optional[Dict]:
-        """Return the record for *datetime_key* or ``None``."""
-        if not Path(self.path).exists():
-            return None
+        """
+        Return the record for *datetime_key* or ``None``.
+
+        Only the matching line is decoded (located by _hour_lines). Should an
+        hour be stored twice, the last line (the cheaper one) wins.
+        """
+        lines = self._hour_lines([datetime_key]).get(datetime_key, [])
+        for _, _, line in reversed(lines):
+            try:
+                rec = _loads(line)
+            except json.JSONDecodeError:
+                continue
+            if rec.get("datetime") == datetime_key:
+                return rec
+        return None
 
-        with open(self.path, "r", encoding="utf-8") as fh:
+    # ------------------------------------------------------------------ #
+    def scan_prices(self) -> List[float]:
+        """
+        Return every recorded price, in file order, without JSON-decoding.
+
+        Set FLIGHT_TRACKER_VERIFY_SCAN=1 to cross-check the result against a
+        full json.loads pass (mismatches are reported on stderr).
+        """
+        try:
+            fd = os.open(self.path, os.O_RDONLY)
+        except FileNotFoundError:
+            return []
+        try:
+            if os.fstat(fd).st_size == 0:  # mmap refuses empty files
+                return []
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                prices = [float(m.group(1)) for m in _PRICE_RE.finditer(mm)]
+        finally:
+            os.close(fd)
+
+        if os.getenv("FLIGHT_TRACKER_VERIFY_SCAN"):
+            expected = self._json_prices()
+            if expected != prices:
+                print(
+                    f"scan_prices mismatch: {len(prices)} scanned vs "
+                    f"{len(expected)} parsed prices in {self.path}",
+                    file=sys.stderr,
+                )
+        return prices
+
+    def _json_prices(self) -> List[float]:
+        """Reference implementation of scan_prices() using json.loads."""
+        prices: list[float] = []
+        with open(self.path, "r", encoding="utf-8", buffering=_READ_BUFFER) as fh:
             for line in fh:
                 try:
-                    rec = json.loads(line)
-                except json.JSONDecodeError:
+                    prices.append(float(json.loads(line)["price"]))
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
                     continue
-                if rec.get("datetime") == datetime_key:
-                    return rec
-        return None
+        return prices
@@ -9,38 +9,169 @@ GUI for the Flight Price Monitor. Divided into three resizable zones:
 Closes to system tray instead of exiting; right-click tray icon to restore or quit.
 
 Changes for instant cancel:
-- Keep a reference to the current FlightBot and call request_cancel() on Cancel.
+- Keep references to the running FlightBots and call request_cancel() on Cancel.
 - Do not auto-start after any user cancel; require explicit Start click.
 - Poll waits at 1s to allow fast cancel during idle.
 """
 
+import functools
+import http.client
 import itertools
 import json
+import mmap
 import os
+import queue
 import random
 import re
 import threading
 import time
+import zlib
 import tkinter as tk
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
+from datetime import date, datetime, timedelta
 from tkinter import END, messagebox, simpledialog, ttk
 
-import matplotlib
+import numpy as np
 import pandas as pd
-import pystray
-from matplotlib.backends.backend_tkagg import (FigureCanvasTkAgg,
-                                               NavigationToolbar2Tk)
-from matplotlib.figure import Figure
-from PIL import Image, ImageDraw
-from win10toast import ToastNotifier
 
 from flight_tracker.airport_from_distance import AirportFromDistance
 from flight_tracker.country_to_airport import CountryToAirport
 from flight_tracker.flight_bot import FlightBot
-from flight_tracker.flight_record import FlightRecord
-from flight_tracker.load_config import ConfigManager
+from flight_tracker.flight_record import FlightRecord, make_record
+from flight_tracker.kernels import nearest_point
+from flight_tracker.load_config import DEFAULT_CONFIG_FILE, ConfigManager
+
+try:  # optional faster decoder; takes the raw bytes of each jsonl line
+    import orjson as _json
+except ImportError:
+    _json = json
+
+# Age after which the cached OurAirports name map is downloaded again
+_AIRPORT_CACHE_MAX_AGE = 7 * 24 * 3600
+# Only columns of the OurAirports CSV the name map needs, read as plain
+# strings (no type inference, no NA detection: a missing value is "")
+_AIRPORT_COLS = ["iata_code", "name"]
+_AIRPORT_CSV_OPTS = {"usecols": _AIRPORT_COLS, "dtype": str, "na_filter": False}
+# What fetching or parsing that CSV can raise: network/SSL/file errors
+# (OSError), a truncated HTTP body, and a malformed or incomplete table
+# (pandas' ParserError/EmptyDataError are ValueErrors, a missing column is a
+# ValueError or KeyError)
+_AIRPORT_CSV_ERRORS = (OSError, http.client.HTTPException, ValueError, KeyError)
+
+# Minimum seconds between flight_records.scan.json writes while records come in
+_SCAN_SNAPSHOT_INTERVAL = 60.0
+
+# Check results buffered before one write to flight_records.jsonl
+_RECORD_BATCH = 20
+
+# Kayak checks run at once in exhaustive mode (each one is a headless Firefox)
+_SCRAPE_WORKERS = 4
+
+# "CDG - Paris Charles de Gaulle, ..." display text of already-resolved airports
+# (match() anchors it; one character after " - " is enough, no need to scan
+# the rest of the text)
+_IATA_HEAD_RE = re.compile(r"[A-Z]{3} - .")
+# the code of each entry of that text, at its start or after the separating
+# comma: a "CODE - Name" entry (second group " - ") or a bare "CODE" added by
+# hand (second group empty). A comma inside an airport name is not followed
+# by a lone code.
+_IATA_TAG_RE = re.compile(r"(?:^|,)\s*([A-Z]{3})(?:( - )|\s*(?=,|$))")
+# a bare IATA code token ("CDG")
+_IATA_RE = re.compile(r"^[A-Z]{3}$")
+# one forbidden interval: two dates separated by a single dash
+_INTERVAL_RE = re.compile(r"^\s*(\d{4}-\d{2}-\d{2})-(\d{4}-\d{2}-\d{2})\s*$")
+# a trip duration "N" or range "N-M" (days), used with fullmatch()
+_DURATION_RE = re.compile(r"\s*(\d+)\s*(?:-\s*(\d+)\s*)?")
+# hourly "datetime" field of a record line, read without decoding the JSON
+_RECORD_TS_RE = re.compile(rb'"datetime":\s*"(\d{4}-\d{2}-\d{2}-\d{2})"')
+
+
+def _record_details(rec: dict, ts: str, day: str, price: float) -> dict:
+    """Details of one flight_records.jsonl entry as shown by the panel/graph."""
+    return {
+        "ts": ts,
+        "date": day,
+        "price": price,
+        "departure": rec.get("departure", ""),
+        "destination": rec.get("destination", ""),
+        "company": rec.get("company", ""),
+        "duration_out": rec.get("duration_out", ""),
+        "duration_return": rec.get("duration_return", ""),
+        "dep_date": rec.get("dep_date"),
+        "arrival_date": rec.get("arrival_date"),
+    }
+
+
+def _airport_names(src) -> dict:
+    """IATA code -> airport name from an OurAirports CSV (path or stream)."""
+    df = pd.read_csv(src, **_AIRPORT_CSV_OPTS)
+    # rows without a 3-letter code are dropped
+    keep = (df["iata_code"].str.len() == 3).to_numpy()
+    return dict(
+        zip(
+            df["iata_code"].to_numpy()[keep].tolist(),
+            df["name"].to_numpy()[keep].tolist(),
+        )
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _departure_dates(first: date, last: date) -> tuple[str, ...]:
+    """Return every day from first to last (inclusive) as YYYY-MM-DD strings."""
+    if last < first:
+        return ()
+    days = pd.date_range(first, last, freq="D")
+    return tuple(days.strftime("%Y-%m-%d"))
+
+
+# The resolvers download the OurAirports tables when built: one of each is kept.
+# Results are memoized per input, as the same city or country is typed again.
+@functools.lru_cache(maxsize=1)
+def _country_resolver() -> CountryToAirport:
+    return CountryToAirport()
+
+
+@functools.lru_cache(maxsize=1)
+def _distance_resolver() -> AirportFromDistance:
+    return AirportFromDistance()
+
 
-matplotlib.use("TkAgg")
+@functools.lru_cache(maxsize=256)
+def _airports_in_country(country: str) -> tuple[str, ...]:
+    """IATA codes of the large scheduled airports of a country."""
+    return tuple(c for c, _ in _country_resolver().get_airports(country))
+
+
+@functools.lru_cache(maxsize=256)
+def _airports_near(place: str, max_minutes: int) -> tuple[str, ...]:
+    """IATA codes of the large airports within max_minutes by train of place."""
+    return tuple(c for c, _ in _distance_resolver().get_airports(place, max_minutes))
+
+
+def _replace_pending(slot: queue.Queue, item) -> None:
+    """Put *item* in the one-slot queue *slot*, dropping a pending one."""
+    while True:
+        try:
+            slot.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                slot.get_nowait()  # drop the stale item
+            except queue.Empty:
+                pass
+
+
+@functools.lru_cache(maxsize=1)
+def _app_root() -> str:
+    """
+    Folder holding assets/: the executable's folder in a frozen app, else the
+    project root (one level above this file). Fixed for the process lifetime.
+    """
+    import sys
+
+    if getattr(sys, "frozen", False):
+        return os.path.dirname(sys.executable)
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 
 class FlightBotGUI(tk.Tk):
@@ -62,18 +193,58 @@ class FlightBotGUI(tk.Tk):
         self._create_result_frame()
         self._create_status_panel()
         self._create_menu()
-        self._load_airport_names()
+        # IATA -> airport name, filled by _load_airport_names on a worker thread
+        # (lookups fall back to "" until then)
+        self.code_to_name: dict[str, str] = {}
+        self._airport_retry_id = None
 
         # state and managers
         self.resolved_airports = {}
+        # field -> text it was resolved from
+        self._last_resolved: dict[str, str] = {}
         self.config_mgr = ConfigManager()
+        # config.json is read once; edits go to this dict and are written back
+        # by _save_config() (debounced) instead of reloading the file each time
+        self._cfg = self.config_mgr.load()
+        self._cfg_save_id = None
         self.record_mgr = FlightRecord()
-        self.notifier = ToastNotifier()
         self.best_prices = {}
+        # every recorded price: filled on first best-price query, then grown in
+        # place (first _n_prices slots valid); _min_price is their running min
+        self._prices_arr: np.ndarray | None = None
+        self._n_prices = 0
+        self._min_price: float | None = None
+        self._prices_sig: tuple[int, int] | None = None  # records (mtime, size)
+        # guards swapping in scan results read by the monitor thread
+        self._cache_lock = threading.Lock()
+        self._reset_jsonl_cache()
+        self._shown_historic_best = None  # record currently in the panel
+        self._shown_historic_text = ""  # and the text it was displayed with
+        self._rng = np.random.default_rng()
         self._first_pass = True
         self._stop_event = threading.Event()
+        self._plot_dirty = threading.Event()
+        # set by the background records scan once the cache is ready to draw
+        self._plot_ready = threading.Event()
+        self._scan_thread: threading.Thread | None = None
+        self._scan_snapshot_dirty = False  # cache advanced since the last snapshot
+        self._scan_snapshot_t = 0.0
+        self._plot_bg = None  # canvas pixels without the hover annotation
+        # latest status text posted by the monitor thread (older ones dropped)
+        self._status_queue: queue.Queue[str] = queue.Queue(maxsize=1)
+        # latest progress-bar state posted by the monitor thread (same scheme)
+        self._progress_queue: queue.Queue[bool] = queue.Queue(maxsize=1)
+        # other Tk actions requested by the monitor thread, run in order
+        self._ui_queue: queue.Queue[tuple[str, object]] = queue.Queue()
         self._monitor_thread = None
-        self._current_bot: FlightBot | None = None  # NEW: live bot reference
+        # running FlightBots (several at once in exhaustive mode), for hard-cancel
+        self._live_bots: set[FlightBot] = set()
+        self._live_bots_lock = threading.Lock()  # pool workers add/remove bots
+        # finished FlightBots whose browser stays open for the next check of
+        # the same monitoring run (closed when the run ends)
+        self._idle_bots: queue.SimpleQueue[FlightBot] = queue.SimpleQueue()
+        # worker threads running the checks, kept for a whole monitoring run
+        self._check_pool: ThreadPoolExecutor | None = None
 
         # After any cancel, require explicit Start click (no auto-start)
         self._allow_auto_start = True
@@ -94,12 +265,21 @@ class FlightBotGUI(tk.Tk):
             self.withdraw()
             self.tray_icon.visible = True
 
-        self._load_historic_best()
-        self._plot_history()
+        self._schedule_refresh()  # first records scan runs off the Tk thread
+        self._start_airport_names_load()
+        self.after(200, self._pump_plot)
+        self.after(100, self._drain_ui_queue)
 
         if self._allow_auto_start and self._fields_complete():
             self._on_start()
 
+    @functools.cached_property
+    def notifier(self):
+        """Windows toast notifier, created (and imported) on first notification."""
+        from win10toast import ToastNotifier
+
+        return ToastNotifier()
+
     def _create_menu(self) -> None:
         """
         Create the main menu bar with:
@@ -129,11 +309,7 @@ class FlightBotGUI(tk.Tk):
         import subprocess
 
         try:
-            if getattr(sys, "frozen", False):
-                target = os.path.dirname(sys.executable)
-            else:
-                # Project root (one level above this file, consistent with _asset_path)
-                target = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            target = _app_root()
 
             if os.name == "nt":
                 os.startfile(target)  # type: ignore[attr-defined]
@@ -148,6 +324,11 @@ class FlightBotGUI(tk.Tk):
         """
         Fully exit the application, ensuring the tray icon is stopped before closing.
         """
+        if self._cfg_save_id is not None:
+            self._save_config(now=True)  # pending debounced config write
+        self._stop_monitor_for_exit()
+        self.record_mgr.close()
+        self._flush_scan_snapshot()
         try:
             if hasattr(self, "tray_icon") and self.tray_icon is not None:
                 try:
@@ -167,6 +348,19 @@ class FlightBotGUI(tk.Tk):
             except Exception:
                 pass
 
+    def _stop_monitor_for_exit(self) -> None:
+        """
+        Stop a running monitor thread and wait (10 s at most) for its finally
+        block, which writes the results still buffered for the current sweep.
+        The thread is a daemon: without this they are lost on exit.
+        """
+        thread = self._monitor_thread
+        if thread is None or not thread.is_alive():
+            return
+        self._stop_event.set()
+        self._cancel_live_bots()
+        thread.join(timeout=10.0)
+
     def _reset_historic(self) -> None:
         """
         Ask for confirmation, then delete the historic search records file and
@@ -180,12 +374,28 @@ class FlightBotGUI(tk.Tk):
         if not proceed:
             return
 
+        # Release the file first: a running scan maps it and the append handle
+        # stays open between saves (either one blocks the delete on Windows).
+        # The store's lock is held from closing the handle to the delete, so
+        # the monitor thread cannot write or reopen it in between.
+        if self._scan_thread is not None and self._scan_thread.is_alive():
+            self._scan_thread.join(timeout=5.0)
+        self._reset_jsonl_cache()
+        self._scan_snapshot_dirty = False
+
         # Remove records file if it exists
-        try:
-            path = getattr(self.record_mgr, "path", "flight_records.jsonl")
-            if os.path.exists(path):
-                os.remove(path)
-        except Exception:
+        removed = True
+        with self.record_mgr.lock:
+            self.record_mgr.close()
+            try:
+                path = getattr(self.record_mgr, "path", "flight_records.jsonl")
+                if os.path.exists(path):
+                    os.remove(path)
+                if os.path.exists(self._scan_snapshot_path()):
+                    os.remove(self._scan_snapshot_path())
+            except Exception:
+                removed = False
+        if not removed:
             messagebox.showerror("Reset failed", "Could not delete the historic records file.")
             return
 
@@ -194,6 +404,12 @@ class FlightBotGUI(tk.Tk):
             self.best_prices.clear()
         except Exception:
             pass
+        self._prices_arr = np.empty(0, dtype=np.float64)
+        self._n_prices = 0
+        self._min_price = None
+        self._prices_sig = None  # file deleted above
+        self._shown_historic_best = None
+        self._shown_historic_text = ""
 
         try:
             self.historic_text.configure(state="normal")
@@ -204,9 +420,11 @@ class FlightBotGUI(tk.Tk):
             pass
 
         try:
-            self.ax.clear()
-            self.ax.set_xlabel("Monitoring timestamp")
-            self.ax.set_ylabel("Price (EUR)")
+            # Keep the reusable line/annotation (see _plot_history), just empty them
+            self._line.set_data([], [])
+            self._point_annotation.set_visible(False)
+            self._annotation_link = None
+            self._plot_xnum = self._plot_ynum = None
             self.canvas.draw_idle()
         except Exception:
             pass
@@ -252,17 +470,24 @@ class FlightBotGUI(tk.Tk):
         ]
 
         self.entries = {}
+        # Entry contents are watched through their StringVar (only real edits
+        # fire, not arrow/modifier keys); Text widgets have no textvariable and
+        # keep a key binding. Both go through the debounced field check.
+        self._entry_vars: dict[str, tk.StringVar] = {}
+        self._fields_check_id = None
         for idx, (lbl_txt, name, multiline) in enumerate(fields):
             tk.Label(frame, text=lbl_txt).grid(
                 row=idx, column=0, padx=5, pady=5, sticky="ne"
             )
-            widget = (
-                tk.Text(frame, width=40, height=3)
-                if multiline
-                else tk.Entry(frame, width=30)
-            )
+            if multiline:
+                widget = tk.Text(frame, width=40, height=3)
+                widget.bind("<KeyRelease>", self._schedule_fields_check)
+            else:
+                var = tk.StringVar(self)
+                var.trace_add("write", self._schedule_fields_check)
+                self._entry_vars[name] = var
+                widget = tk.Entry(frame, width=30, textvariable=var)
             widget.grid(row=idx, column=1, padx=5, pady=5, sticky="ew")
-            widget.bind("<KeyRelease>", lambda ev: self._on_fields_changed())
             self.entries[name] = widget
 
         self.start_button = tk.Button(
@@ -276,6 +501,17 @@ class FlightBotGUI(tk.Tk):
 
     def _create_result_frame(self) -> None:
         """Create the right-hand panel with historic-best info and an interactive graph."""
+        # Matplotlib is the heaviest import of the app: load it only here.
+        import matplotlib
+
+        matplotlib.use("TkAgg")
+        # Let Agg render long price histories in chunks instead of one path
+        matplotlib.rcParams["agg.path.chunksize"] = 10000
+        from matplotlib.backends.backend_tkagg import (FigureCanvasTkAgg,
+                                                       NavigationToolbar2Tk)
+        from matplotlib.dates import DateFormatter
+        from matplotlib.figure import Figure
+
         frame = tk.LabelFrame(self, text="Results")
         frame.grid(row=0, column=1, padx=10, pady=10, sticky="nsew")
         frame.rowconfigure(0, weight=0)
@@ -296,28 +532,60 @@ class FlightBotGUI(tk.Tk):
 
         self.figure = Figure(figsize=(5, 4), dpi=100)
         self.ax = self.figure.add_subplot(111)
-        self.ax.set_xlabel("Monitoring timestamp")
+        self.ax.set_xlabel("Monitoring date")
         self.ax.set_ylabel("Price (EUR)")
-
-        self.canvas = FigureCanvasTkAgg(self.figure, master=gf)
-        self.canvas.draw()
-        self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
-
-        toolbar = NavigationToolbar2Tk(self.canvas, gf, pack_toolbar=False)
-        toolbar.update()
-        toolbar.grid(row=1, column=0, sticky="ew")
-
+        # The history line and its hover annotation live for the whole session;
+        # _plot_history only swaps the line data. No picker on the line: hover
+        # hit-testing is done by _on_motion, only the annotation bubble is
+        # pickable (click-through to Kayak).
+        (self._line,) = self.ax.plot([], [], "-o", picker=False)
+        self.ax.xaxis_date()
+        # Rotated date labels and the bottom margin are set up once; tick
+        # labels created later copy the rotation of the existing ones.
+        self.figure.autofmt_xdate()
         self._point_annotation = self.ax.annotate(
             text="",
             xy=(0, 0),
             xytext=(10, 10),
             textcoords="offset points",
-            bbox=dict(boxstyle="round", fc="yellow", ec="black", lw=0.5),
+            bbox=dict(boxstyle="round", fc="white", ec="black", lw=0.5),
             arrowprops=dict(arrowstyle="->"),
             visible=False,
+            zorder=10,
+            picker=True,
+            animated=True,  # drawn by _blit_annotation, not by full redraws
         )
+        try:
+            self._point_annotation.get_bbox_patch().set_picker(True)
+        except Exception:
+            pass
+        self._plot_xnum = self._plot_ynum = None  # hover data, set by _plot_history
+        self._annotation_link = None
+        self._last_nearest_idx = -2
+        self._motion_event = None  # latest hover event, handled by _flush_motion
+        # Date number -> tooltip timestamp, built once for the hover/pick handlers
+        self._tip_date_fmt = DateFormatter("%Y-%m-%d %H:%M")
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=gf)
+        self.canvas.draw_idle()
+        self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
+
+        toolbar = NavigationToolbar2Tk(self.canvas, gf, pack_toolbar=False)
+        toolbar.update()
+        toolbar.grid(row=1, column=0, sticky="ew")
 
         self.canvas.mpl_connect("pick_event", self._on_pick)
+        self._hover_cid = self.canvas.mpl_connect(
+            "motion_notify_event", self._queue_motion
+        )
+        self._draw_cid = self.canvas.mpl_connect("draw_event", self._on_canvas_draw)
+
+        # NEW: bind F12 once to open the TS archive popup
+        try:
+            self.bind("<F12>", self._show_ts_archive_popup)
+        except Exception:
+            # If binding fails for any reason, do not crash the UI.
+            pass
         self.result_frame = frame
 
     def _create_status_panel(self):
@@ -348,72 +616,137 @@ class FlightBotGUI(tk.Tk):
 
         self.status_panel = sp
 
+    def _start_airport_names_load(self) -> None:
+        """Load the IATA->name map on a worker thread (see _load_airport_names)."""
+        threading.Thread(target=self._load_airport_names, daemon=True).start()
+
     def _load_airport_names(self):
         """
-        Load IATA->airport-name map from OurAirports CSV.
-        If the download fails (e.g., no internet or SSL error), use a local fallback or retry.
+        Load IATA->airport-name map from OurAirports CSV, on a worker thread
+        (the outcome is handed to _on_airport_names() on the Tk thread).
+        A copy younger than a week (airport_names.json) is used as is; an older
+        one is revalidated with If-Modified-Since. If the download fails, use
+        the saved copy whatever its age, else a local fallback, else retry.
         """
         import urllib.error
-        import ssl
-        retry_ms = 60_000  # 1 minute
+        import urllib.request
+        from email.utils import formatdate
 
-        # Try to load from URL, with SSL context to handle verification
+        cache_path = self._airport_cache_path()
+        cached = None
         try:
-            context = ssl._create_unverified_context()
-            df = pd.read_csv(AirportFromDistance.AIRPORTS_URL)
-        except (urllib.error.URLError, ssl.SSLCertVerificationError) as e:
-            # Try to load from local file if available
-            local_path = self._asset_path("airports.csv")
-            if os.path.exists(local_path):
-                df = pd.read_csv(local_path)
-            else:
-                # Ensure the map exists, even if empty
-                if not hasattr(self, "code_to_name") or self.code_to_name is None:
-                    self.code_to_name = {}
-                # Soft status hint; ignore if status_label not ready yet
+            cache_mtime = os.path.getmtime(cache_path)
+            age = time.time() - cache_mtime
+            with open(cache_path, "rb") as fh:
+                names = _json.loads(fh.read())
+            if isinstance(names, dict) and names:
+                if age < _AIRPORT_CACHE_MAX_AGE:
+                    self._post_ui("airports", names)
+                    return
+                cached = names  # stale: revalidated below, or used if offline
+        except (OSError, ValueError):
+            pass  # missing or unreadable cache: download below
+        downloaded = False
+
+        try:
+            request = urllib.request.Request(AirportFromDistance.AIRPORTS_URL)
+            if cached is not None:
+                request.add_header(
+                    "If-Modified-Since", formatdate(cache_mtime, usegmt=True)
+                )
+            try:
+                with urllib.request.urlopen(request) as response:
+                    names = _airport_names(response)
+                downloaded = True
+            except urllib.error.HTTPError as e:
+                if e.code != 304 or cached is None:
+                    raise
+                # Not modified since the saved copy: keep it for another week
                 try:
-                    self.status_label.config(
-                        text="Status: offline, retrying in 1 min (SSL error)"
-                    )
-                except Exception:
+                    os.utime(cache_path)
+                except OSError:
                     pass
-                # Schedule a single retry if none is pending
-                def _retry():
-                    self._airport_retry_id = None
-                    self._load_airport_names()
-                if (
-                    not hasattr(self, "_airport_retry_id")
-                    or self._airport_retry_id is None
-                ):
-                    try:
-                        self._airport_retry_id = self.after(retry_ms, _retry)
-                    except Exception:
-                        # If after() is not available yet, try again on next call path
-                        self._airport_retry_id = None
-                return
+                names = cached
+        except _AIRPORT_CSV_ERRORS:
+            # Offline, or a bad/truncated download
+            if cached is not None:
+                names = cached  # names rarely change: good enough
+            else:
+                # Try to load from local file if available
+                try:
+                    names = _airport_names(self._asset_path("airports.csv"))
+                except _AIRPORT_CSV_ERRORS:
+                    self._post_ui("airports", None)
+                    return
 
-        # Success path: build the code->name map
-        self.code_to_name = {
-            c: n for c, n in zip(df["iata_code"], df["name"]) if pd.notna(c)
-        }
-        # Cancel any pending retry now that data is loaded
-        if (
-            hasattr(self, "_airport_retry_id")
-            and self._airport_retry_id is not None
-        ):
+        if downloaded:
             try:
-                self.after_cancel(self._airport_retry_id)
-            except Exception:
-                pass
-            self._airport_retry_id = None
-        # Optional: refresh status
-        try:
+                with open(cache_path, "w", encoding="utf-8") as fh:
+                    json.dump(names, fh)
+            except (OSError, TypeError, ValueError):
+                pass  # cache is optional; next start downloads again
+        self._post_ui("airports", names)
+
+    def _on_airport_names(self, names: dict | None) -> None:
+        """
+        Tk side of _load_airport_names(): swap in the loaded map and name the
+        airports resolved before it arrived, or show the offline hint and
+        schedule a single retry in 1 minute (names is None).
+        """
+        if names is not None:
+            self.code_to_name = names
+            self._rename_resolved_airports()
+            # Cancel any pending retry now that data is loaded
+            if self._airport_retry_id is not None:
+                try:
+                    self.after_cancel(self._airport_retry_id)
+                except Exception:
+                    pass
+                self._airport_retry_id = None
             self.status_label.config(text="Status: data loaded")
-        except Exception:
-            pass
+            return
+        self.status_label.config(
+            text="Status: offline, retrying in 1 min (SSL error)"
+        )
+        if self._airport_retry_id is None:
+
+            def _retry():
+                self._airport_retry_id = None
+                self._start_airport_names_load()
+
+            self._airport_retry_id = self.after(60_000, _retry)
+
+    def _rename_resolved_airports(self) -> None:
+        """
+        Show "CODE - Name" again for every resolved airport field, with the
+        current code_to_name: fields restored from config.json or resolved
+        before the map was loaded show "CODE - " only. A field the user is
+        editing (text differs from the resolved one) is left alone.
+        """
+        changed = False
+        for field, codes in self.resolved_airports.items():
+            w = self.entries[field]
+            raw = self._get_widget_value(w)
+            if raw not in (self._last_resolved.get(field), self._cfg.get(field)):
+                continue
+            text = ",".join(f"{c} - {self.code_to_name.get(c,'')}" for c in codes)
+            if text == raw:
+                continue
+            if isinstance(w, tk.Text):
+                w.delete("1.0", END)
+                w.insert("1.0", text)
+            else:
+                w.delete(0, END)
+                w.insert(0, text)
+            self._last_resolved[field] = text
+            self._cfg[field] = text
+            changed = True
+        if changed:
+            self._save_config()
+
     def _load_saved_config(self):
         """Restore last inputs and resolved codes from config.json."""
-        saved = self.config_mgr.load()
+        saved = self._cfg
         for key, widget in self.entries.items():
             if key in saved:
                 val = saved[key]
@@ -451,25 +784,33 @@ class FlightBotGUI(tk.Tk):
             return False
         return True
 
+    def _schedule_fields_check(self, *_):
+        """Run _on_fields_changed once typing pauses for 200 ms."""
+        if self._fields_check_id is not None:
+            try:
+                self.after_cancel(self._fields_check_id)
+            except Exception:
+                pass
+        self._fields_check_id = self.after(200, self._on_fields_changed)
+
     def _on_fields_changed(self):
         """
         Stop monitoring if fields become incomplete.
         Do NOT auto-start if fields become complete, unless explicitly allowed.
         After a user cancel, auto-start is disabled until user clicks Start.
         """
+        self._fields_check_id = None
         alive = self._monitor_thread and self._monitor_thread.is_alive()
-        if not self._fields_complete() and alive:
+        if alive and not self._fields_complete():
             self._stop_event.set()
             # Hard-cancel the running bot/driver immediately
-            if self._current_bot is not None:
-                self._current_bot.request_cancel()
+            self._cancel_live_bots()
             self.progress.stop()
             self.status_label.config(text="Status: cancelling...")
             self.cancel_button.config(state="disabled")
             self._wait_for_cancel()
-        # No auto-start on field change when _allow_auto_start is False.
-        if self._fields_complete() and not alive and self._allow_auto_start:
-            pass
+        # No auto-start on field change: completing the fields never starts
+        # monitoring by itself.
 
     def _pre_resolve_airports(self, field):
         """Resolve freeform airport input into IATA codes and display CODE - Name."""
@@ -477,15 +818,23 @@ class FlightBotGUI(tk.Tk):
         raw = self._get_widget_value(w)
         if not raw:
             return
-        if re.match(r"^[A-Z]{3} - .+", raw):
-            codes = [seg.split("-", 1)[0].strip() for seg in raw.split(",")]
-            self.resolved_airports[field] = codes
-            return
-        try:
-            codes = self._resolve_airports(raw)
-        except ValueError as e:
-            messagebox.showerror("Invalid input", f"{field}: {e}")
+        # Focus moved away without editing: the codes are already resolved
+        if raw == self._last_resolved.get(field) and field in self.resolved_airports:
             return
+        if _IATA_HEAD_RE.match(raw):
+            tags = _IATA_TAG_RE.findall(raw)
+            codes = [code for code, _ in tags]
+            if all(sep for _, sep in tags):
+                self.resolved_airports[field] = codes
+                self._last_resolved[field] = raw
+                return
+            # bare codes appended to resolved text: show their names as well
+        else:
+            try:
+                codes = self._resolve_airports(raw)
+            except ValueError as e:
+                messagebox.showerror("Invalid input", f"{field}: {e}")
+                return
         disp = [f"{c} - {self.code_to_name.get(c,'')}" for c in codes]
         if isinstance(w, tk.Text):
             w.delete("1.0", END)
@@ -494,10 +843,29 @@ class FlightBotGUI(tk.Tk):
             w.delete(0, END)
             w.insert(0, ",".join(disp))
         self.resolved_airports[field] = codes
-        cfg = self.config_mgr.load()
-        cfg[field] = ",".join(disp)
-        cfg[f"{field}_codes"] = codes
-        self.config_mgr.save(cfg)
+        self._last_resolved[field] = ",".join(disp)
+        self._cfg[field] = ",".join(disp)
+        self._cfg[f"{field}_codes"] = codes
+        self._save_config()
+
+    def _save_config(self, now: bool = False) -> None:
+        """
+        Write the cached config (self._cfg) to config.json.
+
+        Unless now=True the write is deferred by 1 s and restarted by each new
+        call, so a burst of edits (e.g. tabbing through the airport fields)
+        costs one write.
+        """
+        if self._cfg_save_id is not None:
+            try:
+                self.after_cancel(self._cfg_save_id)
+            except Exception:
+                pass
+            self._cfg_save_id = None
+        if now:
+            self.config_mgr.save(self._cfg)
+        else:
+            self._cfg_save_id = self.after(1000, self._save_config, True)
 
     def _resolve_airports(self, txt):
         """
@@ -508,7 +876,7 @@ class FlightBotGUI(tk.Tk):
         import ssl
 
         toks = [t.strip() for t in txt.split(",") if t.strip()]
-        if all(len(t) == 3 and t.isalpha() and t.isupper() for t in toks):
+        if all(_IATA_RE.match(t) for t in toks):
             return toks
         if len(toks) == 2:
             city, country = toks
@@ -520,16 +888,11 @@ class FlightBotGUI(tk.Tk):
             if dur is None:
                 raise ValueError("Cancelled")
             try:
-                return [
-                    c
-                    for c, _ in AirportFromDistance().get_airports(
-                        f"{city}, {country}", dur
-                    )
-                ]
+                return list(_airports_near(f"{city}, {country}", dur))
             except (urllib.error.URLError, ssl.SSLCertVerificationError) as e:
                 raise ValueError(f"Could not resolve airports: {e}")
         try:
-            return [c for c, _ in CountryToAirport().get_airports(txt)]
+            return list(_airports_in_country(txt.strip()))
         except (urllib.error.URLError, ssl.SSLCertVerificationError) as e:
             raise ValueError(f"Could not resolve airports: {e}")
     def _on_start(self):
@@ -556,20 +919,32 @@ class FlightBotGUI(tk.Tk):
         self._allow_auto_start = False
         self._stop_event.set()
         # Hard-cancel the running bot/driver immediately
-        if self._current_bot is not None:
-            self._current_bot.request_cancel()
+        self._cancel_live_bots()
         self.progress.stop()
         self.status_label.config(text="Status: cancelling...")
         self.cancel_button.config(state="disabled")
         self._wait_for_cancel()
 
+    def _cancel_live_bots(self) -> None:
+        """Hard-cancel every running FlightBot (quits their drivers at once)."""
+        with self._live_bots_lock:
+            bots = tuple(self._live_bots)
+            self._live_bots.clear()
+        for bot in bots:
+            bot.request_cancel()
+
     def _wait_for_cancel(self):
-        """Poll for monitor thread completion and restore UI when done."""
+        """
+        Restore the UI once the monitor thread is done: at once if it already
+        ended, otherwise when its "stopped" message reaches _drain_ui_queue().
+        """
         if self._monitor_thread and self._monitor_thread.is_alive():
-            self.after(100, self._wait_for_cancel)
             return
+        self._monitor_stopped()
+
+    def _monitor_stopped(self):
+        """Forget the finished monitor thread and re-enable Start."""
         self._monitor_thread = None
-        self._current_bot = None
         self.status_label.config(text="Status: idle")
         self.start_button.config(state="normal")
         self.cancel_button.config(state="disabled")
@@ -684,12 +1059,17 @@ class FlightBotGUI(tk.Tk):
             "forbidden_intervals": forbidden,
         }
 
-        # Save config (store entered strings and resolved codes)
-        cfg = {k: self._get_widget_value(w) for k, w in self.entries.items()}
+        # Save config (store entered strings and resolved codes) into the
+        # in-memory dict; the debounced write coalesces it with the
+        # focus-out saves and is flushed on exit
+        cfg = self._cfg
+        cfg.update(
+            {k: self._get_widget_value(w) for k, w in self.entries.items()}
+        )
         cfg["departure_codes"] = deps
         cfg["destination_codes"] = dests
         cfg["max_duration_flight"] = params["max_duration_flight"]
-        self.config_mgr.save(cfg)
+        self._save_config()
 
         # Exhaustive mode keeps the single pair; random mode uses None sentinel
         if random_mode:
@@ -711,20 +1091,63 @@ class FlightBotGUI(tk.Tk):
 
 
     def _get_global_best_price(self):
-        """Return the best price ever recorded, or None if no records."""
-        best = None
-        path = self.record_mgr.path
-        if os.path.exists(path):
-            with open(path, "r", encoding="utf-8") as f:
-                for line in f:
-                    try:
-                        rec = json.loads(line)
-                    except json.JSONDecodeError:
-                        continue
-                    p = rec.get("price")
-                    if best is None or p < best:
-                        best = p
-        return best
+        """
+        Return the best price ever recorded, or None if no records.
+
+        Kept as a running minimum over the scanned prices (see _remember_price),
+        rescanned when the file's (mtime, size) changes; until then the scan
+        cache's best record answers when it is current.
+        """
+        if self._prices_arr is None:
+            with self._cache_lock:
+                cache = self._jsonl_cache
+                mtime, size = cache["mtime"], cache["size"]
+                best = cache["historic_best"]
+            # matching the file's mtime/size means the best record covers the
+            # whole file as it is now
+            if mtime is not None and self._records_sig() == (mtime, size):
+                return best["price"] if best is not None else None
+        self._historic_prices()
+        return self._min_price
+
+    def _historic_prices(self) -> np.ndarray:
+        """
+        Return every recorded price (float64), scanning the records file only once.
+
+        The result is a view of the shared buffer; treat it as read-only.
+        """
+        sig = self._records_sig()
+        if self._prices_arr is None or sig != self._prices_sig:
+            self._prices_sig = sig
+            prices = np.asarray(self.record_mgr.scan_prices(), dtype=np.float64)
+            self._prices_arr = prices
+            self._n_prices = prices.size
+            self._min_price = float(prices.min()) if prices.size else None
+        return self._prices_arr[: self._n_prices]
+
+    def _remember_price(self, price: float) -> None:
+        """Append a freshly saved price to the cached price buffer."""
+        if self._prices_arr is None:
+            # Not scanned yet: the next query reads it back from the file.
+            return
+        if self._n_prices == self._prices_arr.size:
+            # Full: double the capacity (amortized O(1) appends)
+            grown = np.empty(max(16, 2 * self._n_prices), dtype=np.float64)
+            grown[: self._n_prices] = self._prices_arr[: self._n_prices]
+            self._prices_arr = grown
+        self._prices_arr[self._n_prices] = price
+        self._n_prices += 1
+        if self._min_price is None or price < self._min_price:
+            self._min_price = float(price)
+        self._prices_sig = self._records_sig()  # our own save: still in sync
+
+    def _records_sig(self) -> tuple[int, int] | None:
+        """Return (mtime_ns, size) of the records file, or None if it is missing."""
+        try:
+            st = os.stat(self.record_mgr.path)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
 
     def _monitor_loop(self, deps, dests, pairs, params):
         """
@@ -744,7 +1167,10 @@ class FlightBotGUI(tk.Tk):
         random_mode = bool(params.get("random_mode"))
         window_start = params.get("window_start")
         window_end = params.get("window_end")
-        durations = params.get("durations") or []
+        # Durations and the longest trip never change during a run, so convert
+        # them once here instead of re-mapping int() over them every sweep.
+        durations = [int(d) for d in params.get("durations") or []]
+        max_duration = max(durations) if durations else 0
         samples_per_sweep = 10 if random_mode else 0
 
         OFFLINE_WAIT_SEC = 60
@@ -764,9 +1190,12 @@ class FlightBotGUI(tk.Tk):
 
         def _overlaps_forbidden(dd_str: str, rd_str: str) -> bool:
             """Return True if the inclusive trip range overlaps any forbidden interval."""
+            if not forbidden:
+                return False
             try:
-                dd = datetime.strptime(dd_str, "%Y-%m-%d")
-                rd = datetime.strptime(rd_str, "%Y-%m-%d")
+                # ISO dates written by this app: C parser, no strptime
+                dd = datetime.fromisoformat(dd_str)
+                rd = datetime.fromisoformat(rd_str)
             except Exception:
                 return False
             if rd < dd:
@@ -777,10 +1206,40 @@ class FlightBotGUI(tk.Tk):
                     return True
             return False
 
+        # Exhaustive mode checks the same queries on every sweep: drop the
+        # forbidden trips and format the status suffixes once, up front.
+        exhaustive_queries = ()
+        if not random_mode:
+            dep_ret_pairs = [
+                (dd, rd, f" on {dd} -> {rd}")
+                for dd, rd in (pairs or [])
+                if not _overlaps_forbidden(dd, rd)
+            ]
+            exhaustive_queries = tuple(
+                (dep, dest, dd, rd, date_suffix)
+                for dep, dest, (dd, rd, date_suffix) in itertools.product(
+                    deps, dests, dep_ret_pairs
+                )
+            )
+
+        sweep = None
         try:
             while not self._stop_event.is_set():
-                self.status_label.config(text="Status: checking flights...")
-                self.progress.start()
+                self._set_status("Status: checking flights...")
+                self._set_progress(True)
+
+                # Only this thread saves records, so the all-time low is read
+                # once per sweep and then lowered locally as prices come in.
+                # The "3 days ago" reference record is looked up once too.
+                three_days_ago = (datetime.now() - timedelta(days=3)).strftime(
+                    "%Y-%m-%d-%H"
+                )
+                old_rec = self._record_at(three_days_ago)
+                sweep = {
+                    "global_best": self._get_global_best_price(),
+                    "old_price": float(old_rec["price"]) if old_rec else None,
+                    "pending": [],
+                }
 
                 if random_mode:
                     deps_pool = list(deps)
@@ -789,25 +1248,19 @@ class FlightBotGUI(tk.Tk):
                     # Build date pool in the current window based on durations
                     dates_pool = []
                     if window_start and window_end and durations:
-                        latest_dep_all = [
-                            (window_end - timedelta(days=int(d))).date()
-                            for d in durations
-                        ]
-                        latest_dep = min(latest_dep_all) if latest_dep_all else window_end.date()
-                        num_days = max(
-                            0, (latest_dep - window_start.date()).days + 1
+                        latest_dep = (
+                            window_end - timedelta(days=max_duration)
+                        ).date()
+                        dates_pool = list(
+                            _departure_dates(window_start.date(), latest_dep)
                         )
-                        for i in range(num_days):
-                            dates_pool.append(
-                                (window_start + timedelta(days=i)).strftime("%Y-%m-%d")
-                            )
 
                     proposals = self._propose_batch_ts_additive(
                         arch=arch,
                         deps_pool=deps_pool,
                         dests_pool=dests_pool,
                         dates_pool=dates_pool,
-                        durations=list(map(int, durations)) if durations else [],
+                        durations=durations,
                         q=max(1, samples_per_sweep),
                         random_floor_frac=0.10,
                         beam_k=20,
@@ -820,208 +1273,253 @@ class FlightBotGUI(tk.Tk):
                         if not _overlaps_forbidden(dd, rd)
                     ]
 
-                    for dep, dest, dd, rd in proposals:
-                        if self._stop_event.is_set():
-                            break
-
-                        self.status_label.config(
-                            text=f"Checking {dep}->{dest} on {dd} -> {rd}"
-                        )
-                        bot = FlightBot(
-                            departure=dep,
-                            destination=dest,
-                            dep_date=dd,
-                            arrival_date=rd,
-                            max_duration_flight=params["max_duration_flight"],
-                            cancel_event=self._stop_event,
-                            excluded_airlines=params.get("exclude_airlines", []),
-                        )
-                        self._current_bot = bot
-
-                        prev_best = self._get_global_best_price()
-                        rec = bot.start()
-                        is_offline = bool(getattr(bot, "_offline", False))
-                        self._current_bot = None
-                        if self._stop_event.is_set():
-                            break
-
+                    # The batch is fixed before any check runs, so its checks
+                    # can run concurrently like the exhaustive sweep's.
+                    queries = [
+                        (dep, dest, dd, rd, f" on {dd} -> {rd}")
+                        for dep, dest, dd, rd in proposals
+                    ]
+                    offline = False
+                    for (dep, dest, dd, rd, _), rec, is_offline in self._run_checks(
+                        queries, params
+                    ):
                         if is_offline:
-                            try:
-                                self.status_label.config(
-                                    text="Status: offline, retrying in 60s"
-                                )
-                            except Exception:
-                                pass
-                            for _s in range(OFFLINE_WAIT_SEC):
-                                if self._stop_event.is_set():
-                                    break
-                                time.sleep(1)
-                            break
+                            offline = True
+                            continue
 
                         key = self._archive_key(dep, dest, dd, rd)
 
                         if not rec:
-                            gb = self._get_global_best_price()
+                            gb = sweep["global_best"]
                             y = (gb * 1.10) if (gb is not None and gb > 0) else 1.0
                             self._archive_add_observation(arch, key, float(y), today_str)
                             self._archive_save(arch)
                             continue
 
-                        price = float(rec["price"])
-                        timestamp = datetime.now().strftime("%Y-%m-%d-%H")
-                        self.record_mgr.save_record(
-                            timestamp,
-                            dep,
-                            dest,
-                            rec["company"],
-                            rec["duration_out"],
-                            rec["duration_return"],
-                            price,
-                            rec.get("dep_date"),
-                            rec.get("arrival_date"),
-                        )
+                        price = self._process_quote(dep, dest, dd, rec, sweep)
 
                         self._archive_add_observation(arch, key, price, today_str)
                         self._archive_save(arch)
 
-                        global_prev = self._get_global_best_price()
-                        if global_prev is None or price < global_prev:
-                            self.notifier.show_toast(
-                                "New All-Time Low!",
-                                f"{dep}->{dest} on {dd}: EUR {price:.2f}",
-                                duration=10,
-                                threaded=True,
-                            )
-
-                        three_days_ago = (
-                            datetime.now() - timedelta(days=3)
-                        ).strftime("%Y-%m-%d-%H")
-                        old_rec = self.record_mgr.load_record(three_days_ago)
-                        if old_rec and price > float(old_rec["price"]) * 1.1:
-                            diff = price - float(old_rec["price"])
-                            pct = diff / float(old_rec["price"]) * 100.0
-                            self.notifier.show_toast(
-                                "Price Jump Alert",
-                                f"{dep}->{dest} jumped EUR {diff:.2f} (+{pct:.0f}%) vs 3 days ago",
-                                duration=10,
-                                threaded=True,
-                            )
-
                         best_for_pair = self.best_prices.get((dep, dest))
                         if best_for_pair is None or price < best_for_pair:
                             self.best_prices[(dep, dest)] = price
 
-                        self._load_historic_best()
-                        self._plot_history()
+                    if offline and not self._stop_event.is_set():
+                        try:
+                            self._set_status("Status: offline, retrying in 60s")
+                        except Exception:
+                            pass
+                        # returns at once when Cancel sets the event
+                        self._stop_event.wait(OFFLINE_WAIT_SEC)
 
                 else:
-                    dep_ret_pairs = pairs or []
-                    for dep, dest in itertools.product(deps, dests):
-                        best_for_pair = None
-                        for dd, rd in dep_ret_pairs:
-                            if self._stop_event.is_set():
-                                break
-
-                            # NEW: skip if trip overlaps forbidden intervals
-                            if _overlaps_forbidden(dd, rd):
-                                continue
-
-                            self.status_label.config(
-                                text=f"Checking {dep}->{dest} on {dd} -> {rd}"
-                            )
-                            bot = FlightBot(
-                                departure=dep,
-                                destination=dest,
-                                dep_date=dd,
-                                arrival_date=rd,
-                                max_duration_flight=params[
-                                    "max_duration_flight"
-                                ],
-                                cancel_event=self._stop_event,
-                                excluded_airlines=params.get("exclude_airlines", []),
-                            )
-                            self._current_bot = bot
-                            prev_best = self._get_global_best_price()
-                            rec = bot.start()
-                            is_offline = bool(getattr(bot, "_offline", False))
-                            self._current_bot = None
-                            if self._stop_event.is_set():
-                                break
-
-                            if is_offline:
-                                try:
-                                    self.status_label.config(
-                                        text="Status: offline, retrying in 60s"
-                                    )
-                                except Exception:
-                                    pass
-                                for _s in range(OFFLINE_WAIT_SEC):
-                                    if self._stop_event.is_set():
-                                        break
-                                    time.sleep(1)
-                                break
-                            if not rec:
-                                continue
-
-                            price = rec["price"]
-                            if best_for_pair is None or price < best_for_pair:
-                                best_for_pair = price
-
-                            timestamp = datetime.now().strftime("%Y-%m-%d-%H")
-                            self.record_mgr.save_record(
-                                timestamp,
-                                dep,
-                                dest,
-                                rec["company"],
-                                rec["duration_out"],
-                                rec["duration_return"],
-                                price,
-                                rec.get("dep_date"),
-                                rec.get("arrival_date"),
-                            )
+                    offline = False
+                    sweep_best = {}  # (dep, dest) -> cheapest price this sweep
+                    for (dep, dest, dd, rd, _), rec, is_offline in self._run_checks(
+                        exhaustive_queries, params
+                    ):
+                        if is_offline:
+                            offline = True
+                            continue
+                        if not rec:
+                            continue
 
-                            global_prev = self._get_global_best_price()
-                            if global_prev is None or price < global_prev:
-                                self.notifier.show_toast(
-                                    "New All-Time Low!",
-                                    f"{dep}->{dest} on {dd}: EUR {price:.2f}",
-                                    duration=10,
-                                    threaded=True,
-                                )
+                        price = self._process_quote(dep, dest, dd, rec, sweep)
+                        if price < sweep_best.get((dep, dest), float("inf")):
+                            sweep_best[(dep, dest)] = price
+                            self.best_prices[(dep, dest)] = price
 
-                            three_days_ago = (
-                                datetime.now() - timedelta(days=3)
-                            ).strftime("%Y-%m-%d-%H")
-                            old_rec = self.record_mgr.load_record(
-                                three_days_ago
-                            )
-                            if old_rec and price > old_rec["price"] * 1.1:
-                                diff = price - old_rec["price"]
-                                pct = diff / old_rec["price"] * 100
-                                self.notifier.show_toast(
-                                    "Price Jump Alert",
-                                    f"{dep}->{dest} jumped EUR {diff:.2f} (+{pct:.0f}%) vs 3 days ago",
-                                    duration=10,
-                                    threaded=True,
-                                )
+                    if offline and not self._stop_event.is_set():
+                        try:
+                            self._set_status("Status: offline, retrying in 60s")
+                        except Exception:
+                            pass
+                        self._stop_event.wait(OFFLINE_WAIT_SEC)
+
+                self._flush_records(sweep)
+                self._set_progress(False)
+                self._set_status("Status: continuing...")
 
-                            self._load_historic_best()
-                            self._plot_history()
+        finally:
+            self._cancel_live_bots()
+            self._close_check_pool()
+            self._close_idle_bots()
+            if sweep is not None:
+                self._flush_records(sweep)  # results of an interrupted sweep
+            self._set_progress(False)
+            self._set_status("Status: idle")
+            self._post_ui("info", ("FlightBot", "Monitoring loop ended."))
+            # last: _drain_ui_queue() handles the end of the thread after
+            # every other update it posted
+            self._post_ui("stopped", threading.current_thread())
+
+    def _run_checks(self, queries, params):
+        """
+        Run Kayak checks on the run's worker pool (up to _SCRAPE_WORKERS at
+        once) and yield (query, record, offline) as each one finishes.
+
+        Results are handled by the caller, one at a time. Stops after the first
+        offline result or once monitoring is cancelled.
+        """
+        if not queries:
+            return
+        if self._check_pool is None:
+            self._check_pool = ThreadPoolExecutor(max_workers=_SCRAPE_WORKERS)
+        submit = self._check_pool.submit
+        futures = [submit(self._run_bot, q, params) for q in queries]
+        try:
+            for fut in as_completed(futures):
+                if self._stop_event.is_set():
+                    return
+                result = fut.result()
+                yield result
+                if result[2]:
+                    return
+        finally:
+            # Drop the checks that have not started and let the running ones
+            # finish (quickly once cancelled: _stop_event / request_cancel), so
+            # no check of this batch outlives it
+            for fut in futures:
+                fut.cancel()
+            wait(futures)
+
+    def _close_check_pool(self) -> None:
+        """Stop the worker threads of the monitoring run."""
+        pool, self._check_pool = self._check_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _run_bot(self, query, params):
+        """
+        Run one Kayak check (a _run_checks pool worker).
+
+        query is (dep, dest, dep_date, ret_date, status_suffix); returns
+        (query, best record or None, offline flag).
+        """
+        dep, dest, dd, rd, date_suffix = query
+        if self._stop_event.is_set():
+            return query, None, False
+        self._set_status(f"Checking {dep}->{dest}{date_suffix}")
+        # Reuse an idle bot (and its open browser) when there is one: launching
+        # headless Firefox is the slowest part of a check
+        try:
+            bot = self._idle_bots.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            bot.set_query(dep, dest, dd, rd)
+            rec = self._start_bot(bot)
+            if not bot.was_offline():
+                self._idle_bots.put(bot)
+                return query, rec, False
+            # A kept browser that fails may just have died (crashed, window
+            # closed): drop that bot and retry once with a fresh browser before
+            # reporting the network as down
+            bot.close()
+            if self._stop_event.is_set():
+                return query, None, False
+        bot = FlightBot(
+            departure=dep,
+            destination=dest,
+            dep_date=dd,
+            arrival_date=rd,
+            max_duration_flight=params["max_duration_flight"],
+            cancel_event=self._stop_event,
+            excluded_airlines=params.get("exclude_airlines", []),
+            keep_driver=True,
+        )
+        rec = self._start_bot(bot)
+        self._idle_bots.put(bot)
+        return query, rec, bot.was_offline()
+
+    def _start_bot(self, bot: FlightBot):
+        """Run one check of bot, registered in _live_bots so a stop cancels it."""
+        with self._live_bots_lock:
+            self._live_bots.add(bot)
+        try:
+            return bot.start()
+        finally:
+            with self._live_bots_lock:
+                self._live_bots.discard(bot)
 
-                        if best_for_pair is not None:
-                            self.best_prices[(dep, dest)] = best_for_pair
-                        if self._stop_event.is_set():
-                            break
+    def _close_idle_bots(self) -> None:
+        """Quit the browsers kept open by the bots of the monitoring run."""
+        while True:
+            try:
+                bot = self._idle_bots.get_nowait()
+            except queue.Empty:
+                return
+            bot.close()
+
+    def _process_quote(self, dep, dest, dd, rec, sweep) -> float:
+        """
+        Queue one check result for saving and raise the alerts it triggers;
+        return its price.
+
+        sweep holds the per-sweep references: "global_best" (lowered here when
+        the price beats it), "old_price" (price recorded three days ago) and
+        "pending" (records not written yet, see _flush_records).
+        """
+        price = float(rec["price"])
+        timestamp = datetime.now().strftime("%Y-%m-%d-%H")
+        pending = sweep["pending"]
+        pending.append(
+            make_record(
+                timestamp,
+                dep,
+                dest,
+                rec["company"],
+                rec["duration_out"],
+                rec["duration_return"],
+                price,
+                rec.get("dep_date"),
+                rec.get("arrival_date"),
+            )
+        )
+        if len(pending) >= _RECORD_BATCH:
+            self._flush_records(sweep)
+
+        global_best = sweep["global_best"]
+        if global_best is None or price < global_best:
+            sweep["global_best"] = price
+            self._post_ui(
+                "toast",
+                ("New All-Time Low!", f"{dep}->{dest} on {dd}: EUR {price:.2f}"),
+            )
 
-                self.progress.stop()
-                self.status_label.config(text="Status: continuing...")
+        old_price = sweep["old_price"]
+        if old_price and price > old_price * 1.1:
+            diff = price - old_price
+            pct = diff / old_price * 100.0
+            self._post_ui(
+                "toast",
+                (
+                    "Price Jump Alert",
+                    f"{dep}->{dest} jumped EUR {diff:.2f} (+{pct:.0f}%) vs 3 days ago",
+                ),
+            )
 
-        finally:
-            self._current_bot = None
+        return price
 
-        self.progress.stop()
-        self.status_label.config(text="Status: idle")
-        messagebox.showinfo("FlightBot", "Monitoring loop ended.")
+    def _flush_records(self, sweep) -> None:
+        """
+        Write the results buffered in sweep["pending"] with one
+        FlightRecord.save_records() call, then refresh the graph and panel.
+        """
+        pending = sweep["pending"]
+        if not pending:
+            return
+        rewrites = self.record_mgr.rewrites
+        saved = self.record_mgr.save_records(pending)
+        if self.record_mgr.rewrites != rewrites:
+            # Replaced lines took their prices with them: rescan on next use
+            self._prices_arr = None
+        else:
+            for rec in saved:  # a record beaten by a stored one is not written
+                self._remember_price(rec["price"])
+        pending.clear()
+        self._schedule_refresh()
 
     def _filter_airports(self):
         """
@@ -1089,56 +1587,384 @@ class FlightBotGUI(tk.Tk):
                 w.delete(0, END)
                 w.insert(0, text)
 
-        cfg = self.config_mgr.load()
+        cfg = self._cfg
         cfg["departure_codes"] = self.resolved_airports["departure"]
         cfg["destination_codes"] = self.resolved_airports["destination"]
         cfg["departure"] = display["departure"]
         cfg["destination"] = display["destination"]
-        self.config_mgr.save(cfg)
+        self._save_config()
+
+    def _set_status(self, text: str) -> None:
+        """
+        Post a status text from any thread.
+
+        Tk widgets must only be touched from the main thread: the text goes
+        through a one-slot queue drained by _drain_ui_queue(). A newer text
+        replaces a pending one, so bursts within 100 ms cost a single redraw.
+        """
+        _replace_pending(self._status_queue, text)
+
+    def _set_progress(self, running: bool) -> None:
+        """
+        Start (True) or stop (False) the progress bar from any thread.
+
+        Same one-slot queue as _set_status(): a sweep without queries toggles
+        the bar on every pass, and only the latest state is kept.
+        """
+        _replace_pending(self._progress_queue, running)
+
+    def _post_ui(self, kind: str, arg: object = None) -> None:
+        """
+        Queue a Tk action from any thread; _drain_ui_queue() runs it.
+
+        kinds: "toast" ((title, message)), "info" ((title, message) message box),
+        "stopped" (the monitor thread that is ending), "airports" (the loaded
+        airport-name map, None when loading failed, see _on_airport_names).
+        """
+        self._ui_queue.put((kind, arg))
+
+    def _drain_ui_queue(self) -> None:
+        """
+        Run the Tk actions posted by the monitor thread, apply the latest
+        progress state and status text, then re-arm in 100 ms.
+        """
+        while True:
+            try:
+                kind, arg = self._ui_queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                if kind == "toast":
+                    title, msg = arg
+                    self.notifier.show_toast(title, msg, duration=10, threaded=True)
+                elif kind == "info":
+                    messagebox.showinfo(*arg)
+                elif kind == "airports":
+                    self._on_airport_names(arg)
+                elif kind == "stopped":
+                    # ignore a late message from a thread already replaced
+                    if arg is self._monitor_thread:
+                        self._monitor_stopped()
+            except Exception:
+                pass  # a failed toast/widget call must not stop the pump
+        try:
+            running = self._progress_queue.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            if running:
+                self.progress.start()
+            else:
+                self.progress.stop()
+        try:
+            text = self._status_queue.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            self.status_label.config(text=text)
+        self.after(100, self._drain_ui_queue)
+
+    def _schedule_refresh(self) -> None:
+        """
+        Ask for a refresh of the historic-best panel and price graph.
+
+        Safe to call from any thread: it only sets _plot_dirty, which the Tk-side
+        _pump_plot() picks up. Any number of calls between two pump ticks (e.g.
+        the ten samples of a random sweep) end up as one scan and one redraw.
+        """
+        self._plot_dirty.set()
+
+    def _do_refresh(self) -> None:
+        """Redraw the historic-best panel and the price graph once (Tk thread)."""
+        self._load_historic_best()
+        self._plot_history()
+
+    def _pump_plot(self) -> None:
+        """
+        Every 200 ms, start a records scan on a worker thread when a refresh was
+        asked for (_schedule_refresh), and draw its result once it is ready.
+
+        Nothing is drawn while a scan runs, nor while the window is hidden in
+        the tray (scans keep running: the monitor loop reads the cache).
+        """
+        scanning = self._scan_thread is not None and self._scan_thread.is_alive()
+        if (
+            self._plot_ready.is_set()
+            and not scanning
+            and self.state() != "withdrawn"
+        ):
+            self._plot_ready.clear()
+            self._do_refresh()
+        if self._plot_dirty.is_set() and not scanning:
+            self._plot_dirty.clear()
+            self._scan_thread = threading.Thread(
+                target=self._scan_in_background, daemon=True
+            )
+            self._scan_thread.start()
+        self.after(200, self._pump_plot)
+
+    def _scan_in_background(self) -> None:
+        """Worker: fold new records into the cache, then signal the pump."""
+        try:
+            self._scan_records_incremental()
+        finally:
+            self._plot_ready.set()
 
     # Historic-best panel & history graph
-    def _load_historic_best(self) -> None:
+    def _reset_jsonl_cache(self) -> None:
+        """Forget everything folded from flight_records.jsonl so far."""
+        with self._cache_lock:
+            self._jsonl_cache = self._new_jsonl_cache()
+
+    def _new_jsonl_cache(self) -> dict:
+        """Return an empty scan cache."""
+        return {
+            "mtime": None,
+            "size": 0,
+            "offset": 0,  # byte offset just past the last complete line read
+            "crc": 0,  # zlib.crc32 of the file bytes before offset
+            "rewrites": 0,  # FlightRecord.rewrites seen when offset was taken
+            "historic_best": None,
+            "daily_best": {},  # YYYY-MM-DD -> details of that day's cheapest
+            "record_by_ts": {},  # YYYY-MM-DD-HH -> raw hourly record
+            "changed_days": set(),  # daily_best keys set since the last plot
+        }
+
+    def _scan_records_incremental(self) -> dict:
         """
-        Read flight_records.jsonl and show the single cheapest record ever found.
-        Works with both legacy daily records (key date) and the new hourly records
-        (key datetime). Stores a click-through link when dates are available.
-        Now also displays the trip dates (dep_date -> arrival_date) when present.
+        Bring self._jsonl_cache up to date with flight_records.jsonl in one pass.
+
+        Only the lines appended since the last call are decoded. The cache is
+        rebuilt when the file is gone, shrank, is older, or was rewritten,
+        starting from the snapshot of the previous run when its CRC matches.
         """
-        if not os.path.exists(self.record_mgr.path):
-            return
+        from datetime import datetime as _dt
 
-        best = None
-        with open(self.record_mgr.path, "r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    rec = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
+        # Sample the rewrite count and open the file together: FlightRecord
+        # swaps a rewritten file in under the same lock, so the handle is the
+        # file that count describes
+        with self.record_mgr.lock:
+            rewrites = self.record_mgr.rewrites
+            try:
+                fh = open(self.record_mgr.path, "rb")
+            except OSError:
+                fh = None
+        if fh is None:
+            self._reset_jsonl_cache()
+            return self._jsonl_cache
+
+        cache = self._jsonl_cache
+        st = os.fstat(fh.fileno())
+        fresh = cache["mtime"] is None
+        if (
+            st.st_size < cache["offset"]
+            or (cache["mtime"] is not None and st.st_mtime_ns < cache["mtime"])
+            or rewrites != cache["rewrites"]
+        ):
+            # Rebuilt aside and swapped in at the end: the monitor thread
+            # keeps reading the old cache until then
+            cache = self._new_jsonl_cache()
+            cache["rewrites"] = rewrites
+            fresh = True
+        elif st.st_mtime_ns == cache["mtime"] and st.st_size == cache["size"]:
+            fh.close()
+            return cache
+
+        best = cache["historic_best"]
+        # new per-day bests and hourly records, merged under _cache_lock
+        daily_best = {}
+        record_by_ts = {}
+        offset = cache["offset"]
+        crc = cache["crc"]
+        if st.st_size == 0:  # mmap refuses empty files
+            fh.close()
+        else:
+            try:
+                # Scan the mapped bytes for newlines: no per-line str objects or
+                # UTF-8 decoding, each line slice goes straight to the decoder.
+                with fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    snap = self._load_scan_snapshot() if fresh else None
+                    if snap is not None and 0 < snap["offset"] <= len(mm):
+                        with memoryview(mm) as view, view[: snap["offset"]] as head:
+                            if zlib.crc32(head) == snap["crc"]:
+                                # readers skip a cache without mtime: fill it here
+                                best = snap["historic_best"]
+                                cache["daily_best"].update(snap["daily_best"])
+                                cache["record_by_ts"].update(snap["record_by_ts"])
+                                offset, crc = snap["offset"], snap["crc"]
+                    start = offset
+                    while True:
+                        nl = mm.find(b"\n", offset)
+                        if nl < 0:
+                            break  # partially written line: pick it up next time
+                        line = mm[offset:nl]
+                        offset = nl + 1
+                        try:
+                            rec = _json.loads(line)
+                        except json.JSONDecodeError:
+                            continue
 
-                ts_key = "datetime" if "datetime" in rec else "date"
-                if ts_key not in rec or "price" not in rec:
-                    continue
+                        hour_key = rec.get("datetime")
+                        if hour_key is not None:
+                            record_by_ts[hour_key] = rec
 
-                try:
-                    price_val = float(rec["price"])
-                except (TypeError, ValueError):
-                    continue
+                        ts_str = hour_key or rec.get("date")
+                        if ts_str is None or "price" not in rec:
+                            continue
+                        try:
+                            price_val = float(rec["price"])
+                        except (TypeError, ValueError):
+                            continue
+
+                        # Both layouts are fixed-width (YYYY-MM-DD-HH /
+                        # YYYY-MM-DD): validate by slicing instead of strptime,
+                        # and the day key is simply the first 10 characters.
+                        try:
+                            if ts_str[4:5] != "-" or ts_str[7:8] != "-":
+                                raise ValueError(ts_str)
+                            if len(ts_str) == 13 and ts_str[10] == "-":
+                                _dt(
+                                    int(ts_str[0:4]),
+                                    int(ts_str[5:7]),
+                                    int(ts_str[8:10]),
+                                    int(ts_str[11:13]),
+                                )
+                            elif len(ts_str) == 10:
+                                _dt(
+                                    int(ts_str[0:4]),
+                                    int(ts_str[5:7]),
+                                    int(ts_str[8:10]),
+                                )
+                            else:
+                                raise ValueError(ts_str)
+                            day_key = ts_str[:10]
+                        except (TypeError, ValueError):
+                            day_key = None
+
+                        if best is None or price_val < best["price"]:
+                            best = _record_details(rec, ts_str, day_key, price_val)
+                        if day_key is None:
+                            continue
+                        prev = daily_best.get(day_key)
+                        if prev is None:
+                            prev = cache["daily_best"].get(day_key)
+                        if prev is None or price_val < prev["price"]:
+                            daily_best[day_key] = _record_details(
+                                rec, ts_str, day_key, price_val
+                            )
+
+                    if offset > start:
+                        with memoryview(mm) as view, view[start:offset] as new:
+                            crc = zlib.crc32(new, crc)
+            except (OSError, ValueError):
+                return self._jsonl_cache
+
+        advanced = offset != cache["offset"]
+        with self._cache_lock:
+            cache["daily_best"].update(daily_best)
+            cache["record_by_ts"].update(record_by_ts)
+            cache["changed_days"].update(daily_best)
+            cache["historic_best"] = best
+            cache["offset"] = offset
+            cache["crc"] = crc
+            cache["mtime"] = st.st_mtime_ns
+            cache["size"] = st.st_size
+            self._jsonl_cache = cache
+        if advanced:
+            self._scan_snapshot_dirty = True
+            if time.monotonic() - self._scan_snapshot_t >= _SCAN_SNAPSHOT_INTERVAL:
+                self._save_scan_snapshot(cache)
+        return cache
+
+    def _record_at(self, datetime_key: str) -> dict | None:
+        """
+        Return the hourly record saved under 'datetime_key', or None.
+
+        Served from the scan cache once the first scan has run; until then ask
+        FlightRecord, which reads the file.
+        """
+        with self._cache_lock:
+            cache = self._jsonl_cache
+            if cache["mtime"] is not None:
+                return cache["record_by_ts"].get(datetime_key)
+        return self.record_mgr.load_record(datetime_key)
+
+    def _scan_snapshot_path(self) -> str:
+        """Return the path of the scan snapshot, next to the records file."""
+        return os.path.splitext(self.record_mgr.path)[0] + ".scan.json"
+
+    def _load_scan_snapshot(self) -> dict | None:
+        """
+        Load the scan state saved by a previous run, or None if missing/invalid.
+        The caller still checks the CRC against the current records file.
+        """
+        try:
+            with open(self._scan_snapshot_path(), "rb") as fh:
+                snap = _json.loads(fh.read())
+            if not isinstance(snap.get("offset"), int) or not isinstance(
+                snap.get("daily_best"), dict
+            ):
+                return None
+            snap.setdefault("crc", 0)
+            snap.setdefault("historic_best", None)
+            snap.setdefault("record_by_ts", {})
+            return snap
+        except Exception:
+            return None
 
-                if best is None or price_val < best["price"]:
-                    best = {
-                        "ts": rec[ts_key],
-                        "departure": rec.get("departure", ""),
-                        "destination": rec.get("destination", ""),
-                        "company": rec.get("company", ""),
-                        "price": price_val,
-                        "duration_out": rec.get("duration_out", ""),
-                        "duration_ret": rec.get("duration_return", ""),
-                        "dep_date": rec.get("dep_date"),
-                        "arrival_date": rec.get("arrival_date"),
-                    }
-
-        if best is None:
+    def _save_scan_snapshot(self, cache: dict) -> None:
+        """
+        Persist the folded scan state (offset, prefix CRC, bests) so the next
+        start only decodes the lines appended since. Hourly records are kept
+        for the last few days only (see _record_at).
+        """
+        self._scan_snapshot_dirty = False
+        self._scan_snapshot_t = time.monotonic()
+        keep_from = (datetime.now() - timedelta(days=4)).strftime("%Y-%m-%d-%H")
+        snap = {
+            "offset": cache["offset"],
+            "crc": cache["crc"],
+            "historic_best": cache["historic_best"],
+            "daily_best": {
+                day: {k: v for k, v in det.items() if not k.startswith("_")}
+                for day, det in cache["daily_best"].items()
+            },
+            "record_by_ts": {
+                ts: rec
+                for ts, rec in cache["record_by_ts"].items()
+                if ts >= keep_from
+            },
+        }
+        path = self._scan_snapshot_path()
+        try:
+            with open(path + ".tmp", "w", encoding="utf-8") as fh:
+                json.dump(snap, fh)
+            os.replace(path + ".tmp", path)
+        except Exception:
+            # Only a start-up shortcut; the records file stays authoritative.
+            pass
+
+    def _flush_scan_snapshot(self) -> None:
+        """Save a scan state not persisted yet (skipped while a scan is running)."""
+        if not self._scan_snapshot_dirty:
+            return
+        if self._scan_thread is not None and self._scan_thread.is_alive():
             return
+        self._save_scan_snapshot(self._jsonl_cache)
+
+    def _load_historic_best(self) -> None:
+        """
+        Show the single cheapest record ever found.
+        Works with both legacy daily records (key date) and the new hourly records
+        (key datetime). Stores a click-through link when dates are available.
+        Now also displays the trip dates (dep_date -> arrival_date) when present.
+        Reads the last _scan_records_incremental() result; the panel is left
+        alone when the text to show is unchanged.
+        """
+        best = self._jsonl_cache["historic_best"]
+        if best is None or best is self._shown_historic_best:
+            return
+        self._shown_historic_best = best
 
         dd = best.get("dep_date")
         rd = best.get("arrival_date")
@@ -1151,9 +1977,13 @@ class FlightBotGUI(tk.Tk):
             f"Company: {best['company']}\n"
             f"Price: EUR {best['price']:.2f}\n"
             f"Outbound: {best['duration_out']}\n"
-            f"Return:   {best['duration_ret']}\n"
+            f"Return:   {best['duration_return']}\n"
             f"(Click to open search)"
         )
+        # The link below is made of fields of the text: nothing to update either
+        if text == self._shown_historic_text:
+            return
+        self._shown_historic_text = text
         self.historic_text.configure(state="normal")
         self.historic_text.delete("1.0", END)
         self.historic_text.insert(END, text)
@@ -1213,122 +2043,163 @@ class FlightBotGUI(tk.Tk):
         """
         Plot ONE dot per calendar day: the best (lowest) price recorded that day.
 
-        We first aggregate all hourly records into a daily_best map, then plot the
-        per-day minima only. Hover/click still show the full details of that day's
-        best record, including dep/arr dates when available.
+        The per-day minima (daily_best map) are maintained by
+        _scan_records_incremental(); only those are plotted. Hover/click still
+        show the full details of that day's best record, including dep/arr dates
+        when available.
         """
         import matplotlib.dates as mdates  # local import
 
-        if not os.path.exists(self.record_mgr.path):
-            return
-
-        from datetime import datetime as _dt
-
-        # 1) Aggregate: keep only the best (lowest) price per day, with details.
-        daily_best: dict[str, dict] = {}
-        with open(self.record_mgr.path, "r", encoding="utf-8") as fh:
-            for line in fh:
-                try:
-                    rec = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                ts_str = rec.get("datetime") or rec.get("date")
-                if ts_str is None or "price" not in rec:
-                    continue
-
-                try:
-                    fmt = (
-                        "%Y-%m-%d-%H"
-                        if len(ts_str.split("-")) == 4
-                        else "%Y-%m-%d"
-                    )
-                    ts = _dt.strptime(ts_str, fmt)
-                    price_val = float(rec["price"])
-                except (ValueError, TypeError):
-                    continue
-
-                day_key = ts.strftime("%Y-%m-%d")
-                prev = daily_best.get(day_key)
-                if prev is None or price_val < prev.get("price", float("inf")):
-                    daily_best[day_key] = {
-                        "date": day_key,
-                        "price": price_val,
-                        "departure": rec.get("departure", ""),
-                        "destination": rec.get("destination", ""),
-                        "company": rec.get("company", ""),
-                        "duration_out": rec.get("duration_out", ""),
-                        "duration_return": rec.get("duration_return", ""),
-                        "dep_date": rec.get("dep_date"),
-                        "arrival_date": rec.get("arrival_date"),
-                    }
-
+        # 1) Per-day bests, kept up to date by the incremental scan.
+        cache = self._jsonl_cache
+        daily_best = cache["daily_best"]
         if not daily_best:
             return
-
-        # 2) Build per-day series (sorted by date) → one point per day.
-        days_sorted = sorted(daily_best.keys())
-        times = [_dt.strptime(d, "%Y-%m-%d") for d in days_sorted]
-        prices = [daily_best[d]["price"] for d in days_sorted]
-
-        # 3) Plot.
-        self.ax.clear()
-        line_list = self.ax.plot_date(times, prices, "-o", picker=5)
-        self._line = line_list[0]
-
-        # Recreate the annotation on the fresh axes so it can be shown and picked
-        if hasattr(self, "_point_annotation"):
-            try:
-                self._point_annotation.remove()
-            except Exception:
-                pass
-        self._point_annotation = self.ax.annotate(
-            text="",
-            xy=(0, 0),
-            xytext=(10, 10),
-            textcoords="offset points",
-            bbox=dict(boxstyle="round", fc="white", ec="black", lw=0.5),
-            arrowprops=dict(arrowstyle="->"),
-            visible=False,
-            zorder=10,
-            picker=True,
+        changed = cache["changed_days"]
+        same_cache = getattr(self, "_plot_cache", None) is cache
+
+        # Tooltip text, Kayak link and the x coordinate (Matplotlib date number)
+        # are built once per day entry, not on every refresh/hover event;
+        # entries added or replaced by the scan get them here. The new day keys
+        # (ISO "YYYY-MM-DD") are parsed in one datetime64 conversion. While the
+        # same cache is being extended only the days it changed can lack them,
+        # so a refresh does not walk the whole history.
+        candidates = (
+            ((k, daily_best[k]) for k in changed) if same_cache
+            else daily_best.items()
         )
-        try:
-            self._point_annotation.get_bbox_patch().set_picker(True)
-        except Exception:
-            pass
+        fresh = [(k, b) for k, b in candidates if "_text" not in b]
+        if fresh:
+            days64 = np.array([k for k, _ in fresh], dtype="datetime64[D]")
+            xs_new = mdates.date2num(days64).tolist()
+        else:
+            xs_new = []
+        for (day_key, best), x in zip(fresh, xs_new):
+            best["_x"] = x
+            dd = best.get("dep_date")
+            rd = best.get("arrival_date")
+            trip_line = f"Trip: {dd} -> {rd}\n" if dd and rd else ""
+            best["_text"] = (
+                f"Date: {best.get('date','')}\n"
+                f"{trip_line}"
+                f"Best of day: EUR {best.get('price', 0):.2f}\n"
+                f"Route: {best.get('departure','')} -> {best.get('destination','')}\n"
+                f"Company: {best.get('company','')}\n"
+                f"Outbound: {best.get('duration_out','')}\n"
+                f"Return:   {best.get('duration_return','')}"
+            )
+            dep = best.get("departure")
+            dest = best.get("destination")
+            best["_link"] = (
+                (dep, dest, dd, rd) if (dep and dest and dd and rd) else None
+            )
+
+        # 2) Per-day series (sorted by date) → one point per day. While the
+        # same cache is being extended, only the days the scan touched since
+        # the last plot (changed_days) are applied; monitoring only replaces
+        # the latest day or appends new ones, so the series is patched at its
+        # tail. Anything else (first plot, cache rebuilt, older day replaced)
+        # rebuilds the whole series.
+        days = getattr(self, "_plot_days", None)
+        if days and same_cache:
+            if not changed:
+                return  # nothing new: keep the current drawing
+            tail = min(changed) >= days[-1]
+        else:
+            tail = False
+
+        if tail:
+            new_days = sorted(changed)
+            xs, prices = self._plot_xs, self._plot_ys
+            first_new = len(xs)  # first point added or changed by this patch
+            replaced = new_days[0] == days[-1]
+            if replaced:
+                first_new -= 1
+                prices = prices.copy()
+                prices[-1] = daily_best[days[-1]]["price"]
+                new_days = new_days[1:]
+            days.extend(new_days)  # only read by the hover code on this thread
+            days_sorted = days
+            if new_days:
+                xs = np.concatenate((xs, [daily_best[d]["_x"] for d in new_days]))
+                prices = np.concatenate(
+                    (prices, [daily_best[d]["price"] for d in new_days])
+                )
+        else:
+            days_sorted = sorted(daily_best.keys())
+            n = len(days_sorted)
+            xs = np.fromiter((daily_best[d]["_x"] for d in days_sorted), float, n)
+            prices = np.fromiter(
+                (daily_best[d]["price"] for d in days_sorted), float, n
+            )
+        changed.clear()
+        self._plot_cache = cache
+        self._plot_xs, self._plot_ys = xs, prices
+
+        # 3) Plot: swap the data of the persistent line and rescale, instead of
+        # clearing the axes and re-plotting. A tail patch that only appends
+        # days extends the data limits by the new points instead of recomputing
+        # them from every point; replacing the last day's price (by a cheaper
+        # one) can shrink them, so that case recomputes.
+        self._line.set_data(xs, prices)
+        self._point_annotation.set_visible(False)
+        if tail and not replaced:
+            self.ax.update_datalim(
+                np.column_stack((xs[first_new:], prices[first_new:]))
+            )
+        else:
+            self.ax.relim()
+        self.ax.autoscale_view()
 
         # 4) Save data for hover/click handlers.
-        self._plot_times = times
-        self._plot_prices = prices
         self._plot_days = days_sorted  # <— one entry per plotted point
+        # Compact numeric copies for hover hit-testing in _on_motion. float32
+        # keeps day resolution (date2num ~2e4 -> ~3 min steps) and cents; the
+        # kernel upcasts to float64 when applying the affine.
+        self._plot_xnum = xs.astype(np.float32)
+        self._plot_ynum = prices.astype(np.float32)
         self._daily_best = daily_best  # details keyed by YYYY-MM-DD
         self._annotation_link = None  # (dep, dest, dep_date, arrival_date)
+        self._last_nearest_idx = -2  # hover target last drawn (-1: none)
 
-        self.ax.set_xlabel("Monitoring date")
-        self.ax.set_ylabel("Price (EUR)")
-        self.figure.autofmt_xdate()
-
-        # Ensure handlers are connected once
-        if not hasattr(self, "_hover_cid"):
-            self._hover_cid = self.canvas.mpl_connect(
-                "motion_notify_event", self._on_motion
-            )
-        if not hasattr(self, "_pick_cid"):
-            self._pick_cid = self.canvas.mpl_connect(
-                "pick_event", self._on_pick
-            )
+        self.canvas.draw_idle()
 
-        # NEW: bind F12 once to open the TS archive popup
-        if not hasattr(self, "_ts_debug_bound") or not getattr(self, "_ts_debug_bound", False):
-            try:
-                self.bind("<F12>", self._show_ts_archive_popup)
-                self._ts_debug_bound = True
-            except Exception:
-                # If binding fails for any reason, do not crash the UI.
-                self._ts_debug_bound = False
+    def _on_canvas_draw(self, event) -> None:
+        """
+        After every full redraw, keep the canvas pixels (the annotation is
+        animated, so it is not part of them) and put a visible tooltip back on top.
+        """
+        self._plot_bg = self.canvas.copy_from_bbox(self.figure.bbox)
+        if self._point_annotation.get_visible():
+            self.figure.draw_artist(self._point_annotation)
+            self.canvas.blit(self.figure.bbox)
 
-        self.canvas.draw_idle()
+    def _blit_annotation(self) -> None:
+        """
+        Show the current state of the hover annotation by restoring the saved
+        background and drawing only the annotation, instead of repainting the
+        whole figure. Falls back to draw_idle() before the first full draw.
+        """
+        if self._plot_bg is None:
+            self.canvas.draw_idle()
+            return
+        self.canvas.restore_region(self._plot_bg)
+        if self._point_annotation.get_visible():
+            self.figure.draw_artist(self._point_annotation)
+        self.canvas.blit(self.figure.bbox)
+
+    def _queue_motion(self, event) -> None:
+        """Keep the latest motion event; it is handled at most every ~16 ms."""
+        pending = self._motion_event is not None
+        self._motion_event = event
+        if not pending:
+            self.after(16, self._flush_motion)
+
+    def _flush_motion(self) -> None:
+        """Run _on_motion() for the last event queued by _queue_motion()."""
+        event, self._motion_event = self._motion_event, None
+        if event is not None:
+            self._on_motion(event)
 
     def _on_motion(self, event) -> None:
         """
@@ -1339,70 +2210,52 @@ class FlightBotGUI(tk.Tk):
         Improved: the tooltip bubble automatically chooses an offset and alignment
         so it is less likely to be cropped by the window edges.
         """
-        import matplotlib.dates as mdates
-        import numpy as np
-
-        # If the mouse is not over our axes or we have no plotted line yet, hide.
-        if not hasattr(self, "_line") or event.inaxes is not self.ax:
+        # If the mouse is not over our axes, hide.
+        if event.inaxes is not self.ax:
+            self._last_nearest_idx = -1
             if self._point_annotation.get_visible():
                 self._point_annotation.set_visible(False)
                 self._annotation_link = None
-                self.canvas.draw_idle()
+                self._blit_annotation()
             return
 
-        xdata = self._line.get_xdata()
-        ydata = self._line.get_ydata()
-        if xdata is None or ydata is None or len(xdata) == 0:
+        xnum = getattr(self, "_plot_xnum", None)
+        ynum = getattr(self, "_plot_ynum", None)
+        if xnum is None or ynum is None or len(xnum) == 0:
             return
 
-        def _x_to_num(x):
-            try:
-                return float(x)
-            except Exception:
-                try:
-                    return mdates.date2num(x)
-                except Exception:
-                    try:
-                        return mdates.date2num(
-                            np.datetime64(x).astype("datetime64[ns]").astype(object)
-                        )
-                    except Exception:
-                        return None
-
-        # Find nearest plotted point in pixel distance
+        # Find nearest plotted point in pixel distance. Both axes are linear,
+        # so data -> pixels is the affine part of transData; the kernel applies
+        # it and reduces the squared distances in one pass. The matrix is read
+        # per event so zoom/pan/resize are always reflected.
         threshold_px = 8
-        min_dist2 = (threshold_px + 1) ** 2
-        nearest_idx = None
-
-        for i in range(len(xdata)):
-            xn = _x_to_num(xdata[i])
-            if xn is None:
-                continue
-            try:
-                yn = float(ydata[i])
-            except Exception:
-                continue
-            # Data -> display pixels
-            px_py = self.ax.transData.transform(np.array([xn, yn], dtype=float))
-            if px_py.ndim == 1:
-                px, py = float(px_py[0]), float(px_py[1])
-            else:
-                px, py = float(px_py[0, 0]), float(px_py[0, 1])
+        trans = self.ax.transData
+        i, d2 = nearest_point(
+            xnum,
+            ynum,
+            trans.get_affine().get_matrix(),
+            float(event.x),
+            float(event.y),
+        )
+        i = int(i)
+        nearest_idx = i if d2 < (threshold_px + 1) ** 2 else None
+        if nearest_idx is not None:
+            nearest_px, nearest_py = (
+                float(v) for v in trans.transform((xnum[i], ynum[i]))
+            )
 
-            dx = px - event.x
-            dy = py - event.y
-            d2 = dx * dx + dy * dy
-            if d2 < min_dist2:
-                min_dist2 = d2
-                nearest_idx = i
-                nearest_px, nearest_py = px, py  # keep display coords
+        # Same target as the last event: annotation is already up to date
+        hit = -1 if nearest_idx is None else nearest_idx
+        if hit == self._last_nearest_idx:
+            return
+        self._last_nearest_idx = hit
 
         # If no nearby point, hide the tooltip
         if nearest_idx is None:
             if self._point_annotation.get_visible():
                 self._point_annotation.set_visible(False)
                 self._annotation_link = None
-                self.canvas.draw_idle()
+                self._blit_annotation()
             return
 
         # Build the info text, using your existing daily-best mapping
@@ -1410,39 +2263,19 @@ class FlightBotGUI(tk.Tk):
         best = self._daily_best.get(day_key, {}) if hasattr(self, "_daily_best") else {}
 
         if best:
-            dd = best.get("dep_date")
-            rd = best.get("arrival_date")
-            trip_line = f"Trip: {dd} -> {rd}\n" if dd and rd else ""
-            text = (
-                f"Date: {best.get('date','')}\n"
-                f"{trip_line}"
-                f"Best of day: EUR {best.get('price', 0):.2f}\n"
-                f"Route: {best.get('departure','')} -> {best.get('destination','')}\n"
-                f"Company: {best.get('company','')}\n"
-                f"Outbound: {best.get('duration_out','')}\n"
-                f"Return:   {best.get('duration_return','')}"
-            )
-            dep = best.get("departure")
-            dest = best.get("destination")
-            self._annotation_link = (
-                (dep, dest, dd, rd) if (dep and dest and dd and rd) else None
-            )
+            text = best["_text"]
+            self._annotation_link = best["_link"]
         else:
-            xn = _x_to_num(xdata[nearest_idx])
             try:
-                ts_str = mdates.num2date(xn).strftime("%Y-%m-%d %H:%M")
+                ts_str = self._tip_date_fmt(float(xnum[nearest_idx]))
             except Exception:
                 ts_str = ""
-            try:
-                y_val = float(ydata[nearest_idx])
-            except Exception:
-                y_val = ydata[nearest_idx]
-            text = f"{ts_str}\nEUR {y_val:.2f}"
+            text = f"{ts_str}\nEUR {ynum[nearest_idx]:.2f}"
             self._annotation_link = None
 
         # Data coordinates of the point to annotate
-        x_pt = xdata[nearest_idx]
-        y_pt = ydata[nearest_idx]
+        x_pt = xnum[nearest_idx]
+        y_pt = ynum[nearest_idx]
 
         # Choose a safe offset and alignment based on pixel position inside the axes
         xytext, ha, va = self._choose_annotation_offset(nearest_px, nearest_py)
@@ -1456,20 +2289,13 @@ class FlightBotGUI(tk.Tk):
         self._point_annotation.set_position(xytext)  # same as set_xytext
         # Keep an arrow; properties already set when created
 
-        self.canvas.draw_idle()
+        self._blit_annotation()
 
     def _on_pick(self, event) -> None:
         """
-        Pick handler.
-        - Clicking on a data point shows the tooltip (existing behavior).
-        - Clicking on the visible annotation bubble opens the Kayak URL for that day
-          when we have dep/arr dates stored.
+        Pick handler: clicking on the visible annotation bubble opens the Kayak
+        URL for that day when we have dep/arr dates stored.
         """
-        from datetime import datetime as _dt
-
-        import matplotlib.dates as mdates
-        import numpy as np
-
         # Click on annotation bubble or its bbox -> open Kayak if we have a link
         if getattr(event, "artist", None) is not None:
             if event.artist is self._point_annotation or (
@@ -1480,46 +2306,6 @@ class FlightBotGUI(tk.Tk):
                 if link:
                     dep, dest, dd, rd = link
                     self._open_kayak_search(dep, dest, dd, rd)
-                return
-
-        # Otherwise, treat as clicking on a plotted point (line pick)
-        if hasattr(event, "artist") and event.ind:
-            ind = event.ind[0]
-            xdata, ydata = event.artist.get_data()
-            x, y = xdata[ind], ydata[ind]
-
-            ts = None
-            if isinstance(x, (float, np.floating, int, np.integer)):
-                try:
-                    ts = mdates.num2date(float(x))
-                except Exception:
-                    ts = None
-            elif isinstance(x, _dt):
-                ts = x
-            else:
-                try:
-                    ts = mdates.num2date(mdates.date2num(x))
-                except Exception:
-                    ts = None
-
-            if ts is not None:
-                ts_str = ts.strftime("%Y-%m-%d %H:%M")
-                try:
-                    y_val = float(y)
-                except Exception:
-                    y_val = y
-                text = f"{ts_str}\nEUR {y_val:.2f}"
-            else:
-                try:
-                    y_val = float(y)
-                except Exception:
-                    y_val = y
-                text = f"EUR {y_val:.2f}"
-
-            self._point_annotation.xy = (x, y)
-            self._point_annotation.set_text(text)
-            self._point_annotation.set_visible(True)
-            self.canvas.draw_idle()
 
     def _parse_date_single(self, s: str) -> datetime:
         """
@@ -1532,27 +2318,35 @@ class FlightBotGUI(tk.Tk):
         """
         s = s.strip()
 
-        # First validate the format explicitly.
-        if not re.fullmatch(r"\d{4}-\d{2}-\d{2}", s):
+        # First validate the fixed-width format explicitly (digits and dashes
+        # at fixed positions), then build the date straight from the slices.
+        if (
+            len(s) != 10
+            or s[4] != "-"
+            or s[7] != "-"
+            or not (s[0:4] + s[5:7] + s[8:10]).isdecimal()
+            or not s.isascii()
+        ):
             raise ValueError(f"'{s}' does not match YYYY-MM-DD.")
 
         try:
-            return datetime.strptime(s, "%Y-%m-%d")
+            return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]))
         except ValueError as e:
             # Preserve the underlying reason (e.g., "day is out of range for month").
             raise ValueError(f"'{s}' is not a valid calendar date: {e}") from e
 
     def _parse_durations(self, s):
         """Parse 'N' or 'N-M' into a list of integer durations."""
-        parts = s.strip().split("-")
-        if len(parts) == 1:
-            return [int(parts[0])]
-        if len(parts) == 2:
-            lo, hi = int(parts[0]), int(parts[1])
-            if hi < lo:
-                raise ValueError("Invalid duration range")
-            return list(range(lo, hi + 1))
-        raise ValueError("Invalid duration format")
+        m = _DURATION_RE.fullmatch(s)
+        if m is None:
+            raise ValueError("Invalid duration format (use N or N-M)")
+        lo, hi = m.groups()
+        if hi is None:
+            return [int(lo)]
+        lo, hi = int(lo), int(hi)
+        if hi < lo:
+            raise ValueError("Invalid duration range")
+        return list(range(lo, hi + 1))
 
     def _on_close(self):
         """Hide the window and show the tray icon instead of exiting."""
@@ -1565,12 +2359,17 @@ class FlightBotGUI(tk.Tk):
         self.tray_icon.visible = False
 
     def _quit_app(self, icon, item):
-        """Stop the tray icon and exit the application."""
-        icon.stop()
-        self.destroy()
+        """
+        Tray "Quit": runs on the tray thread, so hand the shutdown to the Tk
+        thread (_exit_app also stops the tray icon).
+        """
+        self.after(0, self._exit_app)
 
     def _create_tray_icon(self):
         """Create a tray icon using the project assets or a fallback."""
+        import pystray
+        from PIL import Image, ImageDraw
+
         icon_path = self._asset_path("flight_tracker.ico")
         if os.path.exists(icon_path):
             img = Image.open(icon_path)
@@ -1589,13 +2388,18 @@ class FlightBotGUI(tk.Tk):
 
     def _asset_path(self, *parts: str) -> str:
         """Return an absolute path inside the assets/ folder for dev and frozen apps."""
-        import sys
+        return os.path.join(_app_root(), "assets", *parts)
 
-        if getattr(sys, "frozen", False):
-            root = os.path.dirname(sys.executable)
-        else:
-            root = os.path.dirname(os.path.dirname(__file__))
-        return os.path.join(root, "assets", *parts)
+    def _airport_cache_path(self) -> str:
+        """
+        Return the path of the cached IATA->name map.
+        Lives next to config.json as airport_names.json (see _load_airport_names).
+        """
+        cfg_path = getattr(
+            getattr(self, "config_mgr", None), "path", DEFAULT_CONFIG_FILE
+        )
+        root = os.path.dirname(os.path.abspath(cfg_path))
+        return os.path.join(root, "airport_names.json")
 
     def _weights_path(self) -> str:
         """
@@ -1621,8 +2425,8 @@ class FlightBotGUI(tk.Tk):
         path = self._weights_path()
         try:
             if os.path.exists(path):
-                with open(path, "r", encoding="utf-8") as fh:
-                    data = json.load(fh)
+                with open(path, "rb") as fh:
+                    data = _json.loads(fh.read())
                     # Basic shape guard
                     if not isinstance(data, dict):
                         raise ValueError
@@ -1991,14 +2795,17 @@ class FlightBotGUI(tk.Tk):
 
         gamma = float(arch.get("gamma", 0.98))
         stats = arch.get("stats", {})
+        # Arms share few distinct last_date values: parse each one once
+        deltas: dict[str, int] = {}
         for k, s in list(stats.items()):
             try:
                 last = s.get("last_date")
                 if not last:
                     s["last_date"] = today
                     continue
-                t_last = _dt.strptime(last, fmt)
-                delta = (t_today - t_last).days
+                delta = deltas.get(last)
+                if delta is None:
+                    delta = deltas[last] = (t_today - _dt.strptime(last, fmt)).days
                 if delta <= 0:
                     continue
                 factor = gamma ** float(delta)
@@ -2086,10 +2893,10 @@ class FlightBotGUI(tk.Tk):
         y = np.array(y_list, dtype=float)
         w = np.array(w_list, dtype=float)
 
-        for r, (dep, dest, date) in enumerate(zip(deps, dests, dates)):
+        for r, (dep, dest, day) in enumerate(zip(deps, dests, dates)):
             X[r, idx_dep[dep]] = 1.0
             X[r, len(uniq_dep) + idx_dest[dest]] = 1.0
-            X[r, len(uniq_dep) + len(uniq_dest) + idx_date[date]] = 1.0
+            X[r, len(uniq_dep) + len(uniq_dest) + idx_date[day]] = 1.0
 
         # Weighted ridge: (X^T W X + lambda I)^{-1} X^T W y
         # Use small ridge to stabilize (lambda=1e-3).
@@ -2135,34 +2942,36 @@ class FlightBotGUI(tk.Tk):
         """
         import heapq
         import numpy as np
-        from datetime import datetime as _dt, timedelta as _td
+        from datetime import timedelta as _td
 
         def _ret_date(dd: str, dur: int) -> str:
             try:
-                d0 = _dt.strptime(dd, "%Y-%m-%d")
-                return (d0 + _td(days=int(dur))).strftime("%Y-%m-%d")
+                return (date.fromisoformat(dd) + _td(days=int(dur))).isoformat()
             except Exception:
                 return dd
 
         # 1) Thompson on seen arms
-        seen_candidates = []
+        arms, mus, vars_, ns = [], [], [], []
         stats = arch.get("stats", {})
         for k, s in stats.items():
             try:
                 dep, dest, dd, rd = k.split("|")
             except Exception:
                 continue
-            mu = float(s.get("mu", 0.0))
-            var = max(1e-6, float(s.get("var", 1.0)))
-            n = max(0.0, float(s.get("n", 0.0)))
-            # Posterior sampling: Normal(mu, var/(n+1)) as a pragmatic choice
-            post_var = var / (n + 1.0)
-            sample = np.random.normal(loc=mu, scale=max(1e-6, np.sqrt(post_var)))
-            seen_candidates.append((sample, (dep, dest, dd, rd)))
-
-        seen_candidates.sort(key=lambda t: t[0])  # minimize sample
+            arms.append((dep, dest, dd, rd))
+            mus.append(float(s.get("mu", 0.0)))
+            vars_.append(max(1e-6, float(s.get("var", 1.0))))
+            ns.append(max(0.0, float(s.get("n", 0.0))))
+
         q_seen = int(q * 0.6)
-        picked = [cand for _s, cand in seen_candidates[:q_seen]]
+        picked = []
+        if arms:
+            # Posterior sampling: Normal(mu, var/(n+1)) as a pragmatic choice,
+            # drawn for every arm in one vectorized call.
+            post_sd = np.sqrt(np.asarray(vars_) / (np.asarray(ns) + 1.0))
+            samples = self._rng.normal(loc=mus, scale=np.maximum(1e-6, post_sd))
+            order = np.argsort(samples, kind="stable")  # minimize sample
+            picked = [arms[i] for i in order[:q_seen]]
 
         # 2) Additive surrogate for unseen
         alpha, beta, gamma = self._fit_additive_surrogate(arch)
@@ -2181,6 +2990,32 @@ class FlightBotGUI(tk.Tk):
         top_dest = _topk(beta, beam_k, dests_pool)
         top_dates = _topk(gamma, beam_k, dates_pool)
 
+        # choose 2 representative durations: min and median to diversify
+        if not durations:
+            dur_list = [0]
+        else:
+            durs_sorted = sorted(set(int(x) for x in durations))
+            mid = durs_sorted[len(durs_sorted) // 2]
+            dur_list = (
+                [durs_sorted[0], mid] if len(durs_sorted) > 1 else [durs_sorted[0]]
+            )
+
+        # Return dates only depend on (dep_date, duration): compute the
+        # dates x durations grid once, as datetime64 arithmetic, instead of
+        # once per (dep, dest) beam combination.
+        try:
+            rets = np.array(top_dates, dtype="datetime64[D]")[:, None] + np.array(
+                dur_list, dtype="timedelta64[D]"
+            )
+            ret_dates = {
+                dd: np.datetime_as_string(row, unit="D").tolist()
+                for dd, row in zip(top_dates, rets)
+            }
+        except ValueError:  # malformed date string: per-date fallback
+            ret_dates = {
+                dd: [_ret_date(dd, dur) for dur in dur_list] for dd in top_dates
+            }
+
         # Beam search combinations and score with additive surrogate
         heap = []
         for d in top_dep:
@@ -2190,15 +3025,7 @@ class FlightBotGUI(tk.Tk):
                 # choose a small set of durations for each (d,b)
                 for dd in top_dates:
                     g_score = gamma.get(dd, 0.0)
-                    # choose 2 representative durations: min and median to diversify
-                    if not durations:
-                        dur_list = [0]
-                    else:
-                        durs_sorted = sorted(set(int(x) for x in durations))
-                        mid = durs_sorted[len(durs_sorted) // 2]
-                        dur_list = [durs_sorted[0], mid] if len(durs_sorted) > 1 else [durs_sorted[0]]
-                    for dur in dur_list:
-                        rd = _ret_date(dd, dur)
+                    for rd in ret_dates[dd]:
                         key = self._archive_key(d, b, dd, rd)
                         if key in stats:
                             # already in TS set; skip to avoid duplication
@@ -2272,7 +3099,6 @@ class FlightBotGUI(tk.Tk):
         import json
         import os
         from collections import defaultdict
-        from datetime import datetime as _dt
         import tkinter as _tk
         from tkinter import ttk as _ttk
         from matplotlib.figure import Figure
@@ -2383,7 +3209,8 @@ class FlightBotGUI(tk.Tk):
         if updates_per_day:
             try:
                 days_sorted = sorted(updates_per_day.keys())
-                xs = [_dt.strptime(d, "%Y-%m-%d") for d in days_sorted]
+                # ISO day strings -> datetime64 in one NumPy conversion
+                xs = np.array(days_sorted, dtype="datetime64[D]")
                 ys = [updates_per_day[d] for d in days_sorted]
 
                 fig = Figure(figsize=(7.5, 2.6), dpi=100)
@@ -2489,6 +3316,10 @@ class FlightBotGUI(tk.Tk):
 
         The method is incremental: it remembers the last processed timestamp
         ('last_bootstrap_ts') and only ingests newer records on subsequent calls.
+        It also remembers how far it read ('last_bootstrap_offset') and the CRC
+        of those bytes ('last_bootstrap_crc'): while that prefix is unchanged
+        only the lines appended after it are looked at. A rewritten file (an
+        hour replaced by a cheaper record) fails the CRC and is read whole.
 
         Notes
         -----
@@ -2499,7 +3330,6 @@ class FlightBotGUI(tk.Tk):
         """
         import json
         import os
-        from datetime import datetime as _dt
 
         path = getattr(self.record_mgr, "path", "flight_records.jsonl")
         if not os.path.exists(path):
@@ -2507,55 +3337,81 @@ class FlightBotGUI(tk.Tk):
 
         # Load last processed timestamp (string comparable due to fixed formatting).
         last_ts = arch.get("last_bootstrap_ts", "")
+        last_ts_b = last_ts.encode("ascii", "ignore")
 
         # Collect eligible rows
         rows: list[tuple[str, str, str, str, str, float]] = []
         # tuple: (ts_iso, dep, dest, dep_date, arrival_date, price)
 
-        with open(path, "r", encoding="utf-8") as fh:
-            for line in fh:
-                try:
-                    rec = json.loads(line)
-                except json.JSONDecodeError:
+        try:
+            with open(path, "rb") as fh:
+                if os.fstat(fh.fileno()).st_size == 0:  # mmap refuses empty files
+                    return
+                with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    end = mm.rfind(b"\n") + 1  # complete lines only
+                    start = arch.get("last_bootstrap_offset")
+                    crc = 0
+                    if isinstance(start, int) and 0 < start <= end:
+                        with memoryview(mm) as view, view[:start] as head:
+                            crc = zlib.crc32(head)
+                        if crc != arch.get("last_bootstrap_crc"):
+                            start, crc = 0, 0
+                    else:
+                        start = 0
+                    new_bytes = mm[start:end]
+        except (OSError, ValueError):
+            return
+        arch["last_bootstrap_offset"] = end
+        arch["last_bootstrap_crc"] = zlib.crc32(new_bytes, crc)
+
+        for line in new_bytes.splitlines():
+            # Already-ingested lines are skipped on their raw timestamp
+            # bytes, so only the new tail of the history gets decoded.
+            if last_ts_b:
+                m = _RECORD_TS_RE.search(line)
+                if m is not None and m.group(1) <= last_ts_b:
                     continue
+            try:
+                rec = _json.loads(line)
+            except json.JSONDecodeError:
+                continue
 
-                ts_str = rec.get("datetime") or rec.get("date")
-                if not ts_str:
-                    continue
+            ts_str = rec.get("datetime") or rec.get("date")
+            if not ts_str:
+                continue
 
-                # Normalize timestamp string to YYYY-MM-DD-HH for ordering
-                # If only a date is present, use hour "00".
-                try:
-                    if len(ts_str.split("-")) == 4:
-                        # Already YYYY-MM-DD-HH
-                        ts_norm = ts_str
-                    else:
-                        # Parse as date, reformat with HH=00
-                        t = _dt.strptime(ts_str, "%Y-%m-%d")
-                        ts_norm = t.strftime("%Y-%m-%d-00")
-                except Exception:
-                    continue
+            # Normalize timestamp string to YYYY-MM-DD-HH for ordering
+            # If only a date is present, use hour "00".
+            try:
+                if len(ts_str) == 13:
+                    # Already YYYY-MM-DD-HH
+                    ts_norm = ts_str
+                else:
+                    # Parse as date, reformat with HH=00
+                    ts_norm = date.fromisoformat(ts_str).isoformat() + "-00"
+            except Exception:
+                continue
 
-                # Incremental ingestion: only newer than last_ts
-                if last_ts and not (ts_norm > last_ts):
-                    continue
+            # Incremental ingestion: only newer than last_ts
+            if last_ts and not (ts_norm > last_ts):
+                continue
 
-                dep = rec.get("departure")
-                dest = rec.get("destination")
-                dd = rec.get("dep_date")
-                rd = rec.get("arrival_date")
-                price = rec.get("price", None)
+            dep = rec.get("departure")
+            dest = rec.get("destination")
+            dd = rec.get("dep_date")
+            rd = rec.get("arrival_date")
+            price = rec.get("price", None)
 
-                if not (dep and dest and dd and rd):
-                    continue
-                try:
-                    price_f = float(price)
-                    if not (price_f > 0.0):
-                        continue
-                except Exception:
+            if not (dep and dest and dd and rd):
+                continue
+            try:
+                price_f = float(price)
+                if not (price_f > 0.0):
                     continue
+            except Exception:
+                continue
 
-                rows.append((ts_norm, dep, dest, dd, rd, price_f))
+            rows.append((ts_norm, dep, dest, dd, rd, price_f))
 
         if not rows:
             return
@@ -2691,19 +3547,17 @@ class FlightBotGUI(tk.Tk):
 
         out: list[tuple[datetime, datetime]] = []
         parts = [p.strip() for p in s.split(",") if p.strip()]
-        # Regex captures two dates separated by a single dash between them
-        pat = re.compile(r"^\s*(\d{4}-\d{2}-\d{2})-(\d{4}-\d{2}-\d{2})\s*$")
 
         for part in parts:
-            m = pat.match(part)
+            m = _INTERVAL_RE.match(part)
             if not m:
                 raise ValueError(
                     f"Invalid interval '{part}'. Use YYYY-MM-DD-YYYY-MM-DD."
                 )
             a, b = m.group(1), m.group(2)
             try:
-                dt_a = datetime.strptime(a, "%Y-%m-%d")
-                dt_b = datetime.strptime(b, "%Y-%m-%d")
+                dt_a = self._parse_date_single(a)
+                dt_b = self._parse_date_single(b)
             except ValueError as e:
                 raise ValueError(f"Invalid date in '{part}': {e}") from e
             if dt_b < dt_a:
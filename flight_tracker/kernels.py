@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+kernels.py
+
+Numeric kernel used by the GUI's graph hit-testing.
+
+Numba is an optional speed-up: when it is installed the kernel is
+JIT-compiled (and cached on disk), otherwise it runs as plain NumPy code
+with identical results.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba not installed: run the kernel uncompiled
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit supporting both decorator forms."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, fastmath=True)
+def nearest_point(
+    xs: np.ndarray, ys: np.ndarray, affine: np.ndarray, px: float, py: float
+) -> tuple[int, float]:
+    """
+    Find the data point closest to a display position.
+
+    :param xs: x data coordinates (float32)
+    :param ys: y data coordinates (float32, same length as xs)
+    :param affine: 3x3 data -> display affine matrix (Transform.get_matrix())
+    :param px: display x of the query position (pixels)
+    :param py: display y of the query position (pixels)
+    :return: (index of the nearest point, its squared pixel distance)
+    """
+    dx = affine[0, 0] * xs + affine[0, 1] * ys + affine[0, 2] - px
+    dy = affine[1, 0] * xs + affine[1, 1] * ys + affine[1, 2] - py
+    d2 = dx * dx + dy * dy
+    i = d2.argmin()
+    return i, d2[i]
+
@@ -22,6 +22,9 @@ class ConfigManager:
         """
         self.path = path
         self.config = {}
+        # Text of config.json as last read or written: a save producing the
+        # same text is skipped
+        self._saved_text = None
 
     def load(self):
         """
@@ -33,7 +36,9 @@ class ConfigManager:
             return {}
         try:
             with open(self.path, "r", encoding="utf-8") as f:
-                self.config = json.load(f)
+                text = f.read()
+            self.config = json.loads(text)
+            self._saved_text = text
         except (IOError, json.JSONDecodeError):
             # If file is unreadable or contains invalid JSON, return empty config
             self.config = {}
@@ -45,10 +50,22 @@ class ConfigManager:
 
         :param config: Dict of configuration to save.
         """
+        # Serialize first, then write the text in one call: json.dump() with
+        # an indent emits many small writes, and a value that cannot be
+        # serialized would leave a truncated file behind.
+        text = json.dumps(config, indent=4)
+        if text == self._saved_text:
+            self.config = config
+            return
+        # Write a temporary file and swap it in, so an interrupted write never
+        # leaves a half-written config.json behind
+        tmp_path = self.path + ".tmp"
         try:
-            with open(self.path, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=4)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, self.path)
             self.config = config
+            self._saved_text = text
         except IOError:
             # If file cannot be written, ignore silently
             pass